@@ -0,0 +1,40 @@
+"""Content hashing for change detection (SignalMetadata.raw_data_hash)"""
+
+import hashlib
+from collections.abc import Iterable
+from typing import Any
+
+import orjson
+
+# Canonical encoding: sorted keys, non-str keys allowed, unknown types via str()
+_CANONICAL_OPTIONS = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+
+
+def hash_payload(obj: Any) -> str:
+    """
+    Hash a JSON-like payload.
+
+    orjson writes the canonical bytes directly (no intermediate str), and
+    BLAKE2b-128 gives the same 32-char hex length MD5 did. Not for security -
+    only used to detect whether raw data changed.
+    """
+    return hash_bytes(orjson.dumps(obj, option=_CANONICAL_OPTIONS, default=str))
+
+
+def hash_bytes(data: bytes) -> str:
+    """Hash already-encoded bytes (e.g. a raw HTTP response body)"""
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def hash_items(items: Iterable[Any]) -> str:
+    """
+    Hash a sequence of JSON-like items incrementally.
+
+    Each item is encoded and fed to the hasher on its own, so peak memory is
+    one item's encoding rather than the whole payload's. Callers wanting an
+    order-independent digest should sort the items first.
+    """
+    hasher = hashlib.blake2b(digest_size=16)
+    for item in items:
+        hasher.update(orjson.dumps(item, option=_CANONICAL_OPTIONS, default=str))
+    return hasher.hexdigest()
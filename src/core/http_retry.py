@@ -0,0 +1,75 @@
+"""Retrying HTTP GET for transient API failures (429s, 5xxs, dropped connections)"""
+
+import asyncio
+import random
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from typing import Any
+
+import httpx
+from loguru import logger
+
+# Worth retrying: throttled, or the server/gateway hiccuped
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+
+def _retry_after_seconds(response: httpx.Response) -> float | None:
+    """Parse a Retry-After header (delay-seconds or HTTP-date); None if unusable"""
+    value = response.headers.get("Retry-After")
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=UTC)
+    return max(0.0, (retry_at - datetime.now(UTC)).total_seconds())
+
+
+async def get_with_retry(
+    client: httpx.AsyncClient,
+    url: str,
+    params: dict[str, Any] | None = None,
+    max_attempts: int = 3,
+    base_delay: float = 0.5,
+) -> httpx.Response:
+    """
+    GET with exponential backoff on retryable failures.
+
+    Retries on 429/5xx responses and transport errors, waiting Retry-After
+    when the server sends one, otherwise base_delay * 2**attempt plus a
+    little jitter. Other errors, and the last failed attempt, propagate as
+    httpx exceptions, so callers' existing error handling still applies.
+
+    Returns:
+        The successful response (raise_for_status() already checked)
+    """
+    for attempt in range(max_attempts):
+        last_attempt = attempt == max_attempts - 1
+        try:
+            response = await client.get(url, params=params)
+        except httpx.TransportError as e:
+            if last_attempt:
+                raise
+            delay = base_delay * 2 ** attempt + random.random() * 0.1
+            logger.warning(f"GET {url} failed ({e!r}) - retrying in {delay:.1f}s")
+            await asyncio.sleep(delay)
+            continue
+
+        if response.status_code in RETRYABLE_STATUS_CODES and not last_attempt:
+            delay = _retry_after_seconds(response)
+            if delay is None:
+                delay = base_delay * 2 ** attempt + random.random() * 0.1
+            logger.warning(f"GET {url} returned HTTP {response.status_code} - retrying in {delay:.1f}s")
+            await asyncio.sleep(delay)
+            continue
+
+        response.raise_for_status()
+        return response
+
+    raise RuntimeError("unreachable")  # loop always returns or raises
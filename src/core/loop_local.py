@@ -0,0 +1,38 @@
+"""Per-event-loop shared state for asyncio primitives and HTTP clients"""
+
+import asyncio
+import weakref
+from collections.abc import Callable
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class LoopLocal(Generic[T]):
+    """
+    Lazily created value, one per running event loop.
+
+    Semaphores, locks and httpx clients bind to the loop that first uses
+    them, so keeping one at module or class level breaks the next
+    asyncio.run() in the same process. This hands each loop its own
+    instance and forgets it when the loop is garbage collected.
+    """
+
+    def __init__(self, factory: Callable[[], T]):
+        self._factory = factory
+        self._values: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, T] = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def get(self) -> T:
+        """Return the running loop's value, creating it on first use"""
+        loop = asyncio.get_running_loop()
+        value = self._values.get(loop)
+        if value is None:
+            value = self._factory()
+            self._values[loop] = value
+        return value
+
+    def pop(self) -> T | None:
+        """Forget and return the running loop's value, if any"""
+        return self._values.pop(asyncio.get_running_loop(), None)
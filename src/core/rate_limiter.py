@@ -0,0 +1,78 @@
+"""Async token-bucket rate limiting shared across signal processors"""
+
+import asyncio
+import time
+
+from .loop_local import LoopLocal
+
+
+class TokenBucketLimiter:
+    """
+    Async token bucket.
+
+    Holds up to `capacity` tokens, refilled continuously at `refill_per_sec`.
+    `acquire()` waits until a token is available, so callers are paced
+    before hitting the API instead of after a 429.
+    """
+
+    def __init__(self, capacity: float, refill_per_sec: float):
+        self.capacity = capacity
+        self.refill_per_sec = refill_per_sec
+        self._tokens = capacity
+        self._updated_at = time.monotonic()
+        # Set by backoff(): no tokens are handed out (or accrue) before this
+        self._resume_at = 0.0
+        # Limiters are module-level singletons, so the lock is per event loop
+        self._locks: LoopLocal[asyncio.Lock] = LoopLocal(asyncio.Lock)
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        since = max(self._updated_at, self._resume_at)
+        if now > since:
+            self._tokens = min(
+                self.capacity, self._tokens + (now - since) * self.refill_per_sec
+            )
+        self._updated_at = now
+
+    async def acquire(self, tokens: float = 1.0) -> None:
+        """Wait out any backoff and until `tokens` are available, then consume them"""
+        async with self._locks.get():
+            while True:
+                paused_for = self._resume_at - time.monotonic()
+                if paused_for > 0:
+                    await asyncio.sleep(paused_for)
+                    continue
+                self._refill()
+                if self._tokens >= tokens:
+                    break
+                await asyncio.sleep((tokens - self._tokens) / self.refill_per_sec)
+            self._tokens -= tokens
+
+    def backoff(self, retry_after: float) -> None:
+        """
+        Drain the bucket and pause it for a server-imposed penalty (e.g. HTTP 429).
+
+        Nothing sleeps here: the next acquire() waits until the pause ends, so
+        nobody hits the API again until the window passes, while callers that
+        already hold a response carry on.
+        """
+        self._refill()
+        self._tokens = 0.0
+        self._resume_at = max(self._resume_at, time.monotonic() + retry_after)
+
+
+# One limiter per API host, shared by every processor instance
+_limiters: dict[str, TokenBucketLimiter] = {}
+
+
+def get_rate_limiter(
+    host: str,
+    capacity: float,
+    refill_per_sec: float,
+) -> TokenBucketLimiter:
+    """Get (or create) the shared limiter for an API host"""
+    limiter: TokenBucketLimiter | None = _limiters.get(host)
+    if limiter is None:
+        limiter = TokenBucketLimiter(capacity, refill_per_sec)
+        _limiters[host] = limiter
+    return limiter
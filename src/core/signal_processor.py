@@ -4,6 +4,7 @@ from abc import ABC, abstractmethod
 from typing import List, Optional, Any, Dict
 from datetime import datetime
 from enum import Enum
+import asyncio
 
 from .company import Company
 from .signal import Signal, SignalCategory, SignalMetadata
@@ -110,6 +111,11 @@ class SignalProcessor(ABC):
                 return signal.score
     """
 
+    # Run process() in a worker thread from run(). Set this on processors whose
+    # process() does heavy CPU work (serializing + hashing large payloads) so
+    # it doesn't stall other fetches sharing the event loop.
+    offload_process: bool = False
+
     @property
     @abstractmethod
     def metadata(self) -> SignalProcessorMetadata:
@@ -258,7 +264,10 @@ class SignalProcessor(ABC):
         raw_data = await self.fetch(company, start, end)
 
         # Process to signals
-        signals = self.process(company, raw_data)
+        if self.offload_process:
+            signals = await asyncio.to_thread(self.process, company, raw_data)
+        else:
+            signals = self.process(company, raw_data)
 
         # Validate
         valid_signals = [s for s in signals if self.validate_signal(s)]
@@ -36,12 +36,14 @@ Data Source: GitHub REST API (free, 5000 req/hour)
 Update Frequency: Daily
 """
 
-from typing import List, Any, Dict, Optional
-from datetime import datetime, timedelta
-import hashlib
-import json
+from typing import List, Any, Dict, Optional, Tuple
+from collections import OrderedDict
+from datetime import UTC, datetime, timedelta
+from operator import itemgetter
+import time
 
 import httpx
+import orjson
 from loguru import logger
 
 from ...core.signal_processor import (
@@ -53,6 +55,62 @@ from ...core.signal_processor import (
 )
 from ...core.signal import Signal, SignalCategory, SignalMetadata
 from ...core.company import Company
+from ...core.hashing import hash_payload
+
+
+# Sample data is constant, so it is built once and shared (treat as read-only)
+_UBER_SAMPLE_ORG = {
+    "login": "uber",
+    "name": "Uber Open Source",
+    "public_repos": 157,
+}
+
+_UBER_SAMPLE_REPOS = (
+    {
+        "name": "cadence",
+        "description": "Cadence is a distributed, scalable, durable, and highly available orchestration engine",
+        "stargazers_count": 7500,
+        "forks_count": 580,
+        "updated_at": "2026-02-05T10:30:00Z",
+    },
+    {
+        "name": "kraken",
+        "description": "P2P Docker registry capable of distributing TBs of data in seconds",
+        "stargazers_count": 5900,
+        "forks_count": 430,
+        "updated_at": "2026-02-01T14:20:00Z",
+    },
+    {
+        "name": "h3",
+        "description": "Hexagonal hierarchical geospatial indexing system",
+        "stargazers_count": 4200,
+        "forks_count": 390,
+        "updated_at": "2026-01-28T09:15:00Z",
+    },
+    {
+        "name": "piranha",
+        "description": "A tool for refactoring code related to feature flag APIs",
+        "stargazers_count": 2100,
+        "forks_count": 180,
+        "updated_at": "2026-01-15T16:45:00Z",
+    },
+    {
+        "name": "ludwig",
+        "description": "Data-centric declarative deep learning framework",
+        "stargazers_count": 10500,
+        "forks_count": 1200,
+        "updated_at": "2026-02-06T11:00:00Z",
+    },
+)
+
+# Short-lived memo of process() output keyed by (company_id, repos hash).
+# Daily fetches usually return identical repos, so re-scoring is wasted work.
+_PROCESS_CACHE: "OrderedDict[Tuple[str, str], Tuple[float, List[Signal]]]" = OrderedDict()
+_PROCESS_CACHE_MAXSIZE = 256
+_PROCESS_CACHE_TTL_SECONDS = 3600.0
+
+_get_stars = itemgetter("stargazers_count")
+_get_forks = itemgetter("forks_count")
 
 
 class GitHubActivityProcessor(SignalProcessor):
@@ -80,6 +138,16 @@ class GitHubActivityProcessor(SignalProcessor):
             "TSLA": "tesla",
         }
 
+        # Precomputed (org API URL, repos API URL, public URL) per company
+        self._urls = {
+            cid: (
+                f"{self.api_url}/orgs/{org}",
+                f"{self.api_url}/orgs/{org}/repos",
+                f"https://github.com/{org}",
+            )
+            for cid, org in self.github_orgs.items()
+        }
+
     @property
     def metadata(self) -> SignalProcessorMetadata:
         return SignalProcessorMetadata(
@@ -115,9 +183,11 @@ class GitHubActivityProcessor(SignalProcessor):
             return {}
 
         org_name = self.github_orgs[company.id]
+        org_url, repos_url, _ = self._urls[company.id]
 
         headers = {
             "Accept": "application/vnd.github.v3+json",
+            "Accept-Encoding": "gzip, deflate",
         }
 
         if self.github_token:
@@ -129,15 +199,15 @@ class GitHubActivityProcessor(SignalProcessor):
                 logger.info(f"Fetching GitHub data for org: {org_name}")
 
                 org_response = await client.get(
-                    f"{self.api_url}/orgs/{org_name}",
+                    org_url,
                     headers=headers
                 )
                 org_response.raise_for_status()
-                org_data = org_response.json()
+                org_data = orjson.loads(org_response.content)
 
                 # Get top repositories
                 repos_response = await client.get(
-                    f"{self.api_url}/orgs/{org_name}/repos",
+                    repos_url,
                     headers=headers,
                     params={
                         "sort": "stars",
@@ -146,7 +216,7 @@ class GitHubActivityProcessor(SignalProcessor):
                     }
                 )
                 repos_response.raise_for_status()
-                repos = repos_response.json()
+                repos = orjson.loads(repos_response.content)
 
                 logger.info(f"Found {len(repos)} top repos for {org_name}")
 
@@ -191,23 +261,52 @@ class GitHubActivityProcessor(SignalProcessor):
         if not repos:
             return []
 
+        # The hash is needed for raw_data_hash anyway; reuse it as the cache key
+        data_hash = hash_payload(repos)
+        cache_key = (company.id, data_hash)
+        cached = _PROCESS_CACHE.get(cache_key)
+        if cached is not None:
+            cached_at, cached_signals = cached
+            if time.monotonic() - cached_at < _PROCESS_CACHE_TTL_SECONDS:
+                _PROCESS_CACHE.move_to_end(cache_key)
+                # Hand out copies stamped now: callers may mutate what they
+                # get, and the cached instances must stay pristine
+                refreshed_at = datetime.utcnow()
+                return [
+                    s.model_copy(update={"timestamp": refreshed_at}, deep=True)
+                    for s in cached_signals
+                ]
+            del _PROCESS_CACHE[cache_key]
+
+        # Sanitize once so the aggregations below can use C-level itemgetters
+        # (membership check first so shared sample repos are never written to)
+        for repo in repos:
+            if "stargazers_count" not in repo:
+                repo["stargazers_count"] = 0
+            if "forks_count" not in repo:
+                repo["forks_count"] = 0
+
         # Aggregate metrics
-        total_stars = sum(repo.get("stargazers_count", 0) for repo in repos)
-        total_forks = sum(repo.get("forks_count", 0) for repo in repos)
+        total_stars = sum(map(_get_stars, repos))
+        total_forks = sum(map(_get_forks, repos))
 
         # Find most popular repo
-        top_repo = max(repos, key=lambda r: r.get("stargazers_count", 0))
-        top_repo_stars = top_repo.get("stargazers_count", 0)
+        top_repo = max(repos, key=_get_stars)
+        top_repo_stars = top_repo["stargazers_count"]
         top_repo_name = top_repo.get("name", "")
 
         # Count recently updated repos (active development)
-        thirty_days_ago = datetime.utcnow() - timedelta(days=30)
+        now = datetime.utcnow()
+        thirty_days_ago = now - timedelta(days=30)
         recently_active = 0
         for repo in repos:
             updated = repo.get("updated_at", "")
             if updated:
                 try:
-                    updated_dt = datetime.fromisoformat(updated.replace("Z", "+00:00"))
+                    updated_dt = datetime.fromisoformat(updated)  # 3.11+ parses "Z"
+                    if updated_dt.tzinfo is not None:
+                        # Compare as naive UTC, like every other timestamp here
+                        updated_dt = updated_dt.astimezone(UTC).replace(tzinfo=None)
                     if updated_dt > thirty_days_ago:
                         recently_active += 1
                 except:
@@ -246,11 +345,14 @@ class GitHubActivityProcessor(SignalProcessor):
         description += f" | Top: {top_repo_name} ({top_repo_stars:,}★)"
         description += f" | {recently_active}/{len(repos)} repos active (30d)"
 
+        urls = self._urls.get(company.id)
+        public_url = urls[2] if urls else "https://github.com/"
+
         signal = Signal(
             company_id=company.id,
             signal_type=self.metadata.signal_type,
             category=self.metadata.category,
-            timestamp=datetime.utcnow(),
+            timestamp=now,
             raw_value={
                 "total_stars": total_stars,
                 "total_forks": total_forks,
@@ -263,17 +365,19 @@ class GitHubActivityProcessor(SignalProcessor):
             score=score,
             confidence=confidence,
             metadata=SignalMetadata(
-                source_url=f"https://github.com/{self.github_orgs.get(company.id, '')}",
+                source_url=public_url,
                 source_name="GitHub",
                 processing_notes=f"{total_stars:,} stars, {recently_active} active repos",
-                raw_data_hash=hashlib.md5(
-                    json.dumps(repos, sort_keys=True, default=str).encode()
-                ).hexdigest(),
+                raw_data_hash=data_hash,
             ),
             description=description,
             tags=["github", "open_source", "developer_mindshare"],
         )
 
+        _PROCESS_CACHE[cache_key] = (time.monotonic(), [signal.model_copy(deep=True)])
+        if len(_PROCESS_CACHE) > _PROCESS_CACHE_MAXSIZE:
+            _PROCESS_CACHE.popitem(last=False)
+
         return [signal]
 
     def _get_sample_data(self, company: Company) -> Dict[str, Any]:
@@ -282,58 +386,11 @@ class GitHubActivityProcessor(SignalProcessor):
 
         Realistic sample for Uber's GitHub organization.
         """
-        if company.ticker == "UBER":
-            sample_org = {
-                "login": "uber",
-                "name": "Uber Open Source",
-                "public_repos": 157,
-            }
-
-            sample_repos = [
-                {
-                    "name": "cadence",
-                    "description": "Cadence is a distributed, scalable, durable, and highly available orchestration engine",
-                    "stargazers_count": 7500,
-                    "forks_count": 580,
-                    "updated_at": "2026-02-05T10:30:00Z",
-                },
-                {
-                    "name": "kraken",
-                    "description": "P2P Docker registry capable of distributing TBs of data in seconds",
-                    "stargazers_count": 5900,
-                    "forks_count": 430,
-                    "updated_at": "2026-02-01T14:20:00Z",
-                },
-                {
-                    "name": "h3",
-                    "description": "Hexagonal hierarchical geospatial indexing system",
-                    "stargazers_count": 4200,
-                    "forks_count": 390,
-                    "updated_at": "2026-01-28T09:15:00Z",
-                },
-                {
-                    "name": "piranha",
-                    "description": "A tool for refactoring code related to feature flag APIs",
-                    "stargazers_count": 2100,
-                    "forks_count": 180,
-                    "updated_at": "2026-01-15T16:45:00Z",
-                },
-                {
-                    "name": "ludwig",
-                    "description": "Data-centric declarative deep learning framework",
-                    "stargazers_count": 10500,
-                    "forks_count": 1200,
-                    "updated_at": "2026-02-06T11:00:00Z",
-                },
-            ]
-        else:
-            sample_org = {}
-            sample_repos = []
-
+        is_uber = company.ticker == "UBER"
         return {
             "company_id": company.id,
             "ticker": company.ticker,
-            "org": sample_org,
-            "repos": sample_repos,
+            "org": _UBER_SAMPLE_ORG if is_uber else {},
+            "repos": _UBER_SAMPLE_REPOS if is_uber else [],
             "timestamp": datetime.utcnow(),
         }
@@ -14,8 +14,6 @@ Update Frequency: Monthly
 
 from typing import List, Any, Dict
 from datetime import datetime
-import hashlib
-import json
 
 from loguru import logger
 
@@ -28,6 +26,7 @@ from ...core.signal_processor import (
 )
 from ...core.signal import Signal, SignalCategory, SignalMetadata
 from ...core.company import Company
+from ...core.hashing import hash_payload
 
 
 class ImportExportProcessor(SignalProcessor):
@@ -74,7 +73,7 @@ class ImportExportProcessor(SignalProcessor):
                 source_url="https://usitc.gov",
                 source_name="Import/Export Data",
                 processing_notes=f"{volume} shipments",
-                raw_data_hash=hashlib.md5(json.dumps(raw_data, sort_keys=True).encode()).hexdigest(),
+                raw_data_hash=hash_payload(raw_data),
             ),
             description=f"Trade: {volume} shipments tracked",
             tags=["trade", "logistics"],
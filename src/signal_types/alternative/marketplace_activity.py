@@ -31,10 +31,10 @@ Data Source: eBay API, Amazon Product Advertising API, marketplace scraping
 Update Frequency: Weekly
 """
 
-from typing import List, Any, Dict, Optional
+from typing import List, Any, Dict, Optional, Tuple
 from datetime import datetime, timedelta
-import hashlib
-import json
+from functools import lru_cache
+from types import MappingProxyType
 
 from loguru import logger
 
@@ -47,6 +47,27 @@ from ...core.signal_processor import (
 )
 from ...core.signal import Signal, SignalCategory, SignalMetadata
 from ...core.company import Company
+from ...core.hashing import hash_payload
+
+
+# Constant portion of the sample payload; only identity/timestamp vary per call
+_SAMPLE_METRICS = MappingProxyType({
+    "total_listings": 150,
+    "completed_sales": 45,
+    "seller_count": 12,
+    "average_price": 25.99,
+})
+
+
+# Fields the payload digest covers. The per-fetch timestamp is left out, so
+# identical metrics hash the same and hit the memo below.
+_HASHED_FIELDS = ("company_id", "total_listings", "completed_sales", "seller_count", "average_price")
+
+
+@lru_cache(maxsize=512)
+def _payload_hash(values: Tuple[Any, ...]) -> str:
+    """Digest of the stable marketplace fields, memoized for repeated identical fetches"""
+    return hash_payload(dict(zip(_HASHED_FIELDS, values)))
 
 
 class MarketplaceActivityProcessor(SignalProcessor):
@@ -100,16 +121,24 @@ class MarketplaceActivityProcessor(SignalProcessor):
         if listings == 0:
             return []
 
-        # Calculate score based on activity metrics
-        score = 0
-        score += min(completed_sales / 10, 40)  # Up to +40 for sales volume
-        score += min(seller_count * 5, 30)  # Up to +30 for seller growth
-        score += min((avg_price / 100) * 20, 30)  # Price strength
+        # Calculate score based on activity metrics, as one expression
+        score = (
+            min(completed_sales / 10, 40)  # Up to +40 for sales volume
+            + min(seller_count * 5, 30)  # Up to +30 for seller growth
+            + min(avg_price / 5, 30)  # Price strength: (avg_price / 100) * 20
+        )
 
         score = max(-100, min(100, score))
 
         description = f"Marketplace: {listings} listings, {completed_sales} sales"
 
+        values = tuple(raw_data.get(field) for field in _HASHED_FIELDS)
+        try:
+            data_hash = _payload_hash(values)
+        except TypeError:
+            # Unhashable (nested) values - hash directly without caching
+            data_hash = hash_payload(dict(zip(_HASHED_FIELDS, values)))
+
         signal = Signal(
             company_id=company.id,
             signal_type=self.metadata.signal_type,
@@ -128,9 +157,7 @@ class MarketplaceActivityProcessor(SignalProcessor):
                 source_url="https://ebay.com",
                 source_name="Marketplace Activity",
                 processing_notes=f"{listings} listings tracked",
-                raw_data_hash=hashlib.md5(
-                    json.dumps(raw_data, sort_keys=True, default=str).encode()
-                ).hexdigest(),
+                raw_data_hash=data_hash,
             ),
             description=description,
             tags=["marketplace", "demand"],
@@ -143,9 +170,6 @@ class MarketplaceActivityProcessor(SignalProcessor):
         return {
             "company_id": company.id,
             "ticker": company.ticker,
-            "total_listings": 150,
-            "completed_sales": 45,
-            "seller_count": 12,
-            "average_price": 25.99,
+            **_SAMPLE_METRICS,
             "timestamp": datetime.utcnow(),
         }
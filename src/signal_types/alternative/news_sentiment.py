@@ -24,13 +24,19 @@ Data Source: NewsAPI (free tier) or GDELT (unlimited)
 Update Frequency: Daily
 """
 
-from typing import List, Any, Dict, Optional
+from typing import List, Any, Dict, FrozenSet, Optional, Tuple
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
 from datetime import datetime, timedelta
-import hashlib
-import json
+from functools import lru_cache
+import asyncio
 import re
+import time
 
 import httpx
+import numpy as np
+import orjson
+import pandas as pd
 from loguru import logger
 
 from ...core.signal_processor import (
@@ -42,6 +48,116 @@ from ...core.signal_processor import (
 )
 from ...core.signal import Signal, SignalCategory, SignalMetadata
 from ...core.company import Company
+from ...core.hashing import hash_payload
+from ...core.loop_local import LoopLocal
+
+
+@dataclass(slots=True)
+class ArticleSentiment:
+    """Per-article sentiment record (orjson serializes slotted dataclasses natively)"""
+    title: str
+    sentiment: str
+    score: int
+    published: Optional[str]
+
+
+# NewsAPI rejects longer q= values; batched OR-joined queries stay under it
+_MAX_QUERY_CHARS = 500
+
+
+def _query_clause(company: Company) -> str:
+    """NewsAPI search clause matching the company by name or ticker"""
+    return f'("{company.name}" OR "{company.ticker}")'
+
+
+def _batch_companies(companies: List[Company]) -> List[List[Company]]:
+    """Group companies so each group's OR-joined query fits _MAX_QUERY_CHARS"""
+    batches: List[List[Company]] = []
+    current: List[Company] = []
+    length = 0
+
+    for company in companies:
+        clause_len = len(_query_clause(company)) + len(" OR ")
+        if current and length + clause_len > _MAX_QUERY_CHARS:
+            batches.append(current)
+            current, length = [], 0
+        current.append(company)
+        length += clause_len
+
+    if current:
+        batches.append(current)
+    return batches
+
+
+def _mention_pattern(company: Company) -> re.Pattern:
+    """Caseless match for the company name, or its ticker as a whole word"""
+    return re.compile(
+        rf"{re.escape(company.name)}|\b{re.escape(company.ticker)}\b", re.IGNORECASE
+    )
+
+
+@dataclass(slots=True)
+class _PollEntry:
+    """Last full poll for one (company_id, from, to) window"""
+    polled_at: float
+    total_results: Optional[int]
+    raw_data: Dict[str, Any]
+    signals: Optional[List[Signal]] = None
+
+
+# Polls are kept per processor instance (so different API keys never share
+# entries) in a bounded LRU; NewsAPI quotas reset daily, so they expire then
+_LAST_POLL_MAXSIZE = 256
+_LAST_POLL_TTL_SECONDS = 24 * 3600.0
+
+
+def _copy_raw(raw_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy of cached raw data (fresh article dicts and timestamp) for a caller"""
+    return {
+        **raw_data,
+        "articles": [dict(article) for article in raw_data["articles"]],
+        "timestamp": datetime.utcnow(),
+    }
+
+
+@lru_cache(maxsize=8)
+def _compile_sentiment_pattern(
+    positive: FrozenSet[str], negative: FrozenSet[str]
+) -> Tuple[re.Pattern, int]:
+    """
+    Compile positive/negative keyword sets into one caseless bytes pattern.
+
+    Keywords are plain ASCII, so matching on bytes skips the Unicode paths.
+    Each keyword gets its own capture group - positives first - so a hit is
+    identified by match.lastindex without lowercasing the matched text.
+    Longer keywords come first so a phrase wins over its own prefix.
+
+    Returns:
+        (pattern, number of positive groups)
+    """
+    ordered = (
+        sorted(positive, key=len, reverse=True)
+        + sorted(negative, key=len, reverse=True)
+    )
+    pattern = re.compile(
+        b"|".join(b"(%s)" % re.escape(kw.encode()) for kw in ordered),
+        re.IGNORECASE,
+    )
+    return pattern, len(positive)
+
+
+def _classify(pos_counts: np.ndarray, neg_counts: np.ndarray) -> np.ndarray:
+    """
+    Score articles from their keyword counts.
+
+    More positive keywords = +10 each, more negative = -10 each (capped at
+    100), ties = 0. Branch-free selects over the whole batch.
+    """
+    return np.where(
+        pos_counts > neg_counts,
+        np.minimum(pos_counts * 10, 100),
+        np.where(neg_counts > pos_counts, -np.minimum(neg_counts * 10, 100), 0),
+    ).astype(np.int16)
 
 
 class NewsSentimentProcessor(SignalProcessor):
@@ -72,6 +188,75 @@ class NewsSentimentProcessor(SignalProcessor):
         self.newsapi_key = newsapi_key
         self.newsapi_url = "https://newsapi.org/v2/everything"
 
+        # Both keyword sets compiled into a single caseless bytes pattern so
+        # each article is scanned in one pass; the group index tells the sets
+        # apart. Shared across instances with the same keyword sets.
+        self._sentiment_re, self._positive_groups = _compile_sentiment_pattern(
+            frozenset(self.POSITIVE_KEYWORDS), frozenset(self.NEGATIVE_KEYWORDS)
+        )
+
+        # (company_id, from, to) -> last full poll, for the totalResults probe
+        self._last_poll: "OrderedDict[Tuple[str, str, str], _PollEntry]" = OrderedDict()
+
+        # Shared pooled client (one per event loop): concurrent fetch() calls
+        # reuse connections (and multiplex over HTTP/2) instead of a TLS
+        # handshake per call
+        self._clients: LoopLocal[httpx.AsyncClient] = LoopLocal(
+            lambda: httpx.AsyncClient(
+                http2=True,
+                timeout=30.0,
+                limits=httpx.Limits(max_connections=20, max_keepalive_connections=20),
+            )
+        )
+
+    async def aclose(self) -> None:
+        """Close the running loop's shared HTTP client"""
+        client = self._clients.pop()
+        if client is not None:
+            await client.aclose()
+
+    async def _search(
+        self, query: str, date_from: str, date_to: str, page_size: int = 100
+    ) -> Dict[str, Any]:
+        """
+        Run one NewsAPI /everything search (100 articles is the page maximum).
+
+        Returns:
+            Dict with trimmed "articles" (title, description, publishedAt only)
+            and "total_results"
+        """
+        params = {
+            "q": query,
+            "from": date_from,
+            "to": date_to,
+            "sortBy": "publishedAt",
+            "language": "en",
+            "pageSize": page_size,
+            "apiKey": self.newsapi_key,
+        }
+
+        logger.info(f"Fetching news from NewsAPI: {query}")
+        response = await self._clients.get().get(self.newsapi_url, params=params)
+        response.raise_for_status()
+
+        data = orjson.loads(response.content)
+
+        # Keep only the fields process() reads; full article bodies would
+        # otherwise ride along into raw_data and every hash downstream
+        articles = [
+            {
+                "title": article.get("title") or "",
+                "description": article.get("description") or "",
+                "publishedAt": article.get("publishedAt"),
+            }
+            for article in data.get("articles", [])
+        ]
+
+        return {
+            "articles": articles,
+            "total_results": data.get("totalResults", len(articles)),
+        }
+
     @property
     def metadata(self) -> SignalProcessorMetadata:
         return SignalProcessorMetadata(
@@ -104,55 +289,138 @@ class NewsSentimentProcessor(SignalProcessor):
             logger.warning("No NewsAPI key provided - using sample data")
             return self._get_sample_news(company, start, end)
 
-        # Build search query
-        query = f'"{company.name}" OR "{company.ticker}"'
-
-        # NewsAPI free tier: max 1 month back
-        # Ensure start is not more than 30 days ago
-        max_start = datetime.utcnow() - timedelta(days=30)
-        if start < max_start:
-            start = max_start
-
-        params = {
-            "q": query,
-            "from": start.strftime("%Y-%m-%d"),
-            "to": end.strftime("%Y-%m-%d"),
-            "sortBy": "publishedAt",
-            "language": "en",
-            "pageSize": 100,  # Max articles
-            "apiKey": self.newsapi_key,
-        }
+        date_from, date_to = self._window(start, end)
+        query = _query_clause(company)
+        poll_key = (company.id, date_from, date_to)
 
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                logger.info(f"Fetching news for {company.ticker} from NewsAPI")
-                response = await client.get(self.newsapi_url, params=params)
-                response.raise_for_status()
+            # ETag-style short-circuit: a one-article probe of totalResults;
+            # the full page is only downloaded when the count has moved
+            entry = self._last_poll.get(poll_key)
+            if entry is not None and time.monotonic() - entry.polled_at >= _LAST_POLL_TTL_SECONDS:
+                del self._last_poll[poll_key]
+                entry = None
+            if entry is not None:
+                probe = await self._search(query, date_from, date_to, page_size=1)
+                if probe["total_results"] == entry.total_results:
+                    self._last_poll.move_to_end(poll_key)
+                    logger.info(f"News unchanged for {company.ticker} - reusing last poll")
+                    return _copy_raw(entry.raw_data)
+
+            data = await self._search(query, date_from, date_to)
+            articles = data["articles"]
+            logger.info(f"Found {len(articles)} news articles for {company.ticker}")
+
+            raw_data = {
+                "company_id": company.id,
+                "ticker": company.ticker,
+                "articles": articles,
+                "total_results": data["total_results"],
+                "window": (date_from, date_to),
+                "timestamp": datetime.utcnow(),
+            }
+
+            self._last_poll[poll_key] = _PollEntry(
+                time.monotonic(), data["total_results"], _copy_raw(raw_data)
+            )
+            self._last_poll.move_to_end(poll_key)
+            if len(self._last_poll) > _LAST_POLL_MAXSIZE:
+                self._last_poll.popitem(last=False)
+
+            return raw_data
 
-                data = response.json()
+        except Exception as e:
+            self._log_fetch_error(e)
+            return {}
+
+    async def fetch_many(
+        self,
+        companies: List[Company],
+        start: datetime,
+        end: datetime
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch news for several companies with as few NewsAPI requests as possible.
+
+        The free tier allows 100 requests/day, so co-scheduled companies share
+        OR-joined queries of the form ("Name A" OR "TICKA") OR ("Name B" OR
+        "TICKB"), split to fit NewsAPI's query length limit, and articles are
+        routed back by name/ticker mention. A combined query still returns at
+        most one page (100 articles) shared by its companies, and NewsAPI's
+        totalResults only describes the whole query, so total_results is None
+        for companies fetched in a multi-company batch.
+
+        Returns:
+            Dict of company_id -> raw data (same shape as fetch(); {} on error)
+        """
+        if not self.newsapi_key:
+            logger.warning("No NewsAPI key provided - using sample data")
+            return {
+                company.id: self._get_sample_news(company, start, end)
+                for company in companies
+            }
+
+        date_from, date_to = self._window(start, end)
+        batches = _batch_companies(companies)
+        results = await asyncio.gather(
+            *(
+                self._search(" OR ".join(map(_query_clause, batch)), date_from, date_to)
+                for batch in batches
+            ),
+            return_exceptions=True,
+        )
 
-                articles = data.get("articles", [])
+        now = datetime.utcnow()
+        raw_by_company: Dict[str, Dict[str, Any]] = {}
+        for batch, data in zip(batches, results):
+            if isinstance(data, BaseException):
+                self._log_fetch_error(data)
+                raw_by_company.update((company.id, {}) for company in batch)
+                continue
+
+            for company in batch:
+                if len(batch) == 1:
+                    # Unbatched: every article belongs to this company
+                    articles, total_results = data["articles"], data["total_results"]
+                else:
+                    mention = _mention_pattern(company)
+                    articles = [
+                        article for article in data["articles"]
+                        if mention.search(f"{article['title']} {article['description']}")
+                    ]
+                    total_results = None
                 logger.info(f"Found {len(articles)} news articles for {company.ticker}")
 
-                return {
+                raw_by_company[company.id] = {
                     "company_id": company.id,
                     "ticker": company.ticker,
                     "articles": articles,
-                    "total_results": data.get("totalResults", len(articles)),
-                    "timestamp": datetime.utcnow(),
+                    "total_results": total_results,
+                    "window": (date_from, date_to),
+                    "timestamp": now,
                 }
 
-        except httpx.HTTPStatusError as e:
+        return raw_by_company
+
+    @staticmethod
+    def _window(start: datetime, end: datetime) -> Tuple[str, str]:
+        """NewsAPI from/to dates; the free tier only reaches 30 days back"""
+        max_start = datetime.utcnow() - timedelta(days=30)
+        if start < max_start:
+            start = max_start
+        return start.strftime("%Y-%m-%d"), end.strftime("%Y-%m-%d")
+
+    @staticmethod
+    def _log_fetch_error(e: BaseException) -> None:
+        if isinstance(e, httpx.HTTPStatusError):
             if e.response.status_code == 401:
                 logger.error("Invalid NewsAPI key")
             elif e.response.status_code == 429:
                 logger.warning("NewsAPI rate limit exceeded (100 req/day on free tier)")
             else:
                 logger.error(f"NewsAPI error: {e}")
-            return {}
-        except Exception as e:
+        else:
             logger.error(f"Error fetching news: {e}")
-            return {}
 
     def process(self, company: Company, raw_data: Dict[str, Any]) -> List[Signal]:
         """
@@ -168,45 +436,67 @@ class NewsSentimentProcessor(SignalProcessor):
         if not articles:
             return []
 
-        # Analyze sentiment of each article
-        sentiments = []
-        positive_count = 0
-        negative_count = 0
-        neutral_count = 0
-
-        for article in articles:
-            title = article.get("title", "")
-            description = article.get("description", "")
-            text = f"{title} {description}".lower()
-
-            # Count sentiment keywords
-            pos_score = sum(1 for kw in self.POSITIVE_KEYWORDS if kw in text)
-            neg_score = sum(1 for kw in self.NEGATIVE_KEYWORDS if kw in text)
-
-            # Classify article
-            if pos_score > neg_score:
-                sentiment = "positive"
-                positive_count += 1
-                score = min(pos_score * 10, 100)
-            elif neg_score > pos_score:
-                sentiment = "negative"
-                negative_count += 1
-                score = -min(neg_score * 10, 100)
-            else:
-                sentiment = "neutral"
-                neutral_count += 1
-                score = 0
+        # Unchanged poll (same window and totalResults as the last full
+        # download): reuse the signal already built for it
+        entry = None
+        if "window" in raw_data:
+            entry = self._last_poll.get((company.id, *raw_data["window"]))
+            if entry is not None and entry.total_results != raw_data.get("total_results"):
+                entry = None
+        if entry is not None and entry.signals is not None:
+            logger.info(f"News unchanged for {company.ticker} - reusing last signal")
+            # Copies stamped now, so the cached instance stays pristine
+            refreshed_at = datetime.utcnow()
+            return [
+                s.model_copy(update={"timestamp": refreshed_at}, deep=True)
+                for s in entry.signals
+            ]
 
-            sentiments.append({
-                "title": title,
-                "sentiment": sentiment,
-                "score": score,
-                "published": article.get("publishedAt"),
-            })
+        # Columnar extraction: title/description/publishedAt pulled out and
+        # concatenated + ASCII-encoded for all articles at once
+        total_articles = len(articles)
+        frame = pd.DataFrame(articles, columns=["title", "description", "publishedAt"])
+        title_col = frame["title"].fillna("").astype(str)
+        texts = (title_col + " " + frame["description"].fillna("").astype(str)).str.encode(
+            "ascii", "ignore"
+        )
+        titles = title_col.tolist()
+        published = frame["publishedAt"].astype(object).where(
+            frame["publishedAt"].notna(), None
+        ).tolist()
+
+        # Keyword counts go straight into preallocated arrays; scoring is
+        # then one vectorized pass and labels are just the sign of the score
+        pos_counts = np.empty(total_articles, dtype=np.int32)
+        neg_counts = np.empty(total_articles, dtype=np.int32)
+        positive_groups = self._positive_groups
+
+        for i, text in enumerate(texts):
+            # Count distinct sentiment keywords present (single scan)
+            hit_groups = {match.lastindex for match in self._sentiment_re.finditer(text)}
+            pos_counts[i] = sum(group <= positive_groups for group in hit_groups)
+            neg_counts[i] = len(hit_groups) - pos_counts[i]
+
+        scores = _classify(pos_counts, neg_counts)
+
+        is_positive = scores > 0
+        is_negative = scores < 0
+        positive_count = int(is_positive.sum())
+        negative_count = int(is_negative.sum())
+        neutral_count = total_articles - positive_count - negative_count
+
+        sentiments = [
+            ArticleSentiment(
+                title=title,
+                sentiment="positive" if score > 0 else "negative" if score < 0 else "neutral",
+                score=score,
+                published=published_at,
+            )
+            for title, score, published_at in zip(titles, scores.tolist(), published)
+        ]
 
         # Calculate aggregate sentiment
-        total_articles = len(articles)
-        avg_score = sum(s["score"] for s in sentiments) / total_articles if total_articles > 0 else 0
+        avg_score = float(scores.mean())
 
         # Normalize to -100 to +100
         avg_score = max(-100, min(100, avg_score))
@@ -219,23 +509,21 @@ class NewsSentimentProcessor(SignalProcessor):
         sentiment_breakdown = f"{positive_count} positive, {negative_count} negative, {neutral_count} neutral"
         description = f"News sentiment: {avg_score:+.0f}/100 from {total_articles} articles ({sentiment_breakdown})"
 
-        # Add top headlines
+        # Add top headlines (argmax of a boolean mask = first True index)
         if positive_count > 0:
-            top_positive = [s for s in sentiments if s["sentiment"] == "positive"][:2]
-            if top_positive:
-                description += f" | Positive: {top_positive[0]['title'][:60]}..."
+            top_positive = titles[int(is_positive.argmax())]
+            description += f" | Positive: {top_positive[:60]}..."
 
         if negative_count > 0:
-            top_negative = [s for s in sentiments if s["sentiment"] == "negative"][:2]
-            if top_negative:
-                description += f" | Negative: {top_negative[0]['title'][:60]}..."
+            top_negative = titles[int(is_negative.argmax())]
+            description += f" | Negative: {top_negative[:60]}..."
 
         signal = Signal(
             company_id=company.id,
             signal_type=self.metadata.signal_type,
             category=self.metadata.category,
             timestamp=datetime.utcnow(),
-            raw_value={"articles": sentiments, "stats": {"total": total_articles, "positive": positive_count, "negative": negative_count}},
+            raw_value={"articles": [asdict(s) for s in sentiments], "stats": {"total": total_articles, "positive": positive_count, "negative": negative_count}},
             normalized_value=avg_score / 100.0,
             score=int(avg_score),
             confidence=confidence,
@@ -243,14 +531,15 @@ class NewsSentimentProcessor(SignalProcessor):
                 source_url="https://newsapi.org",
                 source_name="NewsAPI",
                 processing_notes=f"Analyzed {total_articles} articles",
-                raw_data_hash=hashlib.md5(
-                    json.dumps(sentiments, sort_keys=True, default=str).encode()
-                ).hexdigest(),
+                raw_data_hash=hash_payload(sentiments),
             ),
             description=description,
             tags=["news", "sentiment", "media"],
         )
 
+        if entry is not None:
+            entry.signals = [signal.model_copy(deep=True)]
+
         return [signal]
 
     def _get_sample_news(self, company: Company, start: datetime, end: datetime) -> Dict[str, Any]:
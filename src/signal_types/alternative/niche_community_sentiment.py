@@ -36,13 +36,13 @@ Data Source: Reddit API, Discord (if available), HackerNews API, specialized for
 Update Frequency: Daily (some communities are real-time)
 """
 
-from typing import List, Any, Dict, Optional
+from typing import List, Any, Dict, FrozenSet, Optional
 from datetime import datetime, timedelta
-import hashlib
-import json
+from functools import lru_cache
 import re
 
 import httpx
+import pandas as pd
 from loguru import logger
 
 from ...core.signal_processor import (
@@ -54,6 +54,14 @@ from ...core.signal_processor import (
 )
 from ...core.signal import Signal, SignalCategory, SignalMetadata
 from ...core.company import Company
+from ...core.hashing import hash_items
+
+
+@lru_cache(maxsize=8)
+def _compile_keyword_pattern(keywords: FrozenSet[str]) -> re.Pattern:
+    """Compile a keyword set into one caseless capturing alternation (longest first)"""
+    ordered = sorted(keywords, key=len, reverse=True)
+    return re.compile("(" + "|".join(map(re.escape, ordered)) + ")", re.IGNORECASE)
 
 
 class NicheCommunitySentimentProcessor(SignalProcessor):
@@ -116,9 +124,29 @@ class NicheCommunitySentimentProcessor(SignalProcessor):
         "revolutionary",
     ]
 
+    # Issue triggers (a post can hit several categories at once)
+    BUG_KEYWORDS = ["bug", "broken", "not working"]
+    COMPETITOR_KEYWORDS = ["competitor", "alternative", "switch"]
+    PRICING_KEYWORDS = ["expensive", "price", "cost"]
+
     def __init__(self):
         """Initialize processor"""
-        pass
+        # Frozen per-category keyword sets: routing a hit back to its
+        # categories is a hash lookup rather than a list scan
+        self._category_keywords = {
+            "positive": frozenset(self.POSITIVE_KEYWORDS),
+            "negative": frozenset(self.NEGATIVE_KEYWORDS),
+            "bug": frozenset(self.BUG_KEYWORDS),
+            "competitor": frozenset(self.COMPETITOR_KEYWORDS),
+            "pricing": frozenset(self.PRICING_KEYWORDS),
+        }
+
+        # Every category compiled into a single caseless alternation so each
+        # post is scanned in one pass; hits are routed back to categories by
+        # keyword. Shared across instances with the same keyword set.
+        self._keyword_re = _compile_keyword_pattern(
+            frozenset().union(*self._category_keywords.values())
+        )
 
     @property
     def metadata(self) -> SignalProcessorMetadata:
@@ -172,38 +200,26 @@ class NicheCommunitySentimentProcessor(SignalProcessor):
         if not posts:
             return []
 
-        # Metrics
         total_posts = len(posts)
-        positive_count = 0
-        negative_count = 0
-        bug_mentions = 0
-        competitor_mentions = 0
-        pricing_complaints = 0
-
-        for post in posts:
-            content = post.get("content", "").lower()
-            community = post.get("community", "")
 
-            # Count sentiment
-            for keyword in self.POSITIVE_KEYWORDS:
-                if keyword in content:
-                    positive_count += 1
-                    break  # Count once per post
+        contents = pd.Series([post.get("content", "") for post in posts], dtype=object)
 
-            for keyword in self.NEGATIVE_KEYWORDS:
-                if keyword in content:
-                    negative_count += 1
-                    break
+        # One scan over all posts for every category; each metric is the
+        # number of distinct posts with at least one keyword from that category
+        matched = contents.str.extractall(self._keyword_re)[0].str.lower()
+        post_ids = matched.index.get_level_values(0)
 
-            # Specific issues
-            if "bug" in content or "broken" in content or "not working" in content:
-                bug_mentions += 1
+        def posts_matching(category: str) -> int:
+            keywords = self._category_keywords[category]
+            return int(post_ids[matched.isin(keywords).to_numpy()].nunique())
 
-            if "competitor" in content or "alternative" in content or "switch" in content:
-                competitor_mentions += 1
+        positive_count = posts_matching("positive")
+        negative_count = posts_matching("negative")
 
-            if "expensive" in content or "price" in content or "cost" in content:
-                pricing_complaints += 1
+        # Specific issues
+        bug_mentions = posts_matching("bug")
+        competitor_mentions = posts_matching("competitor")
+        pricing_complaints = posts_matching("pricing")
 
         # Calculate score
         net_sentiment = positive_count - negative_count
@@ -261,9 +277,7 @@ class NicheCommunitySentimentProcessor(SignalProcessor):
                 source_url="https://reddit.com",
                 source_name="Niche Communities",
                 processing_notes=f"{total_posts} posts analyzed",
-                raw_data_hash=hashlib.md5(
-                    json.dumps(posts, sort_keys=True, default=str).encode()
-                ).hexdigest(),
+                raw_data_hash=hash_items(posts),
             ),
             description=description,
             tags=["niche_communities", "sentiment", "forums"],
@@ -33,12 +33,16 @@ Alternative: Google Patents Public Datasets (BigQuery)
 Update Frequency: Monthly (patents publish ~18 months after filing)
 """
 
-from typing import List, Any, Dict, Optional
-from datetime import datetime, timedelta
-import hashlib
-import json
+from typing import List, Any, Dict, Optional, Tuple
+from datetime import datetime
+from collections import OrderedDict
+import asyncio
+import copy
+import re
+import time
 
 import httpx
+import orjson
 from loguru import logger
 
 from ...core.signal_processor import (
@@ -50,11 +54,62 @@ from ...core.signal_processor import (
 )
 from ...core.signal import Signal, SignalCategory, SignalMetadata
 from ...core.company import Company
+from ...core.hashing import hash_payload
+from ...core.http_retry import get_with_retry
+from ...core.loop_local import LoopLocal
+from ...core.rate_limiter import get_rate_limiter
+
+
+_PATENTSVIEW_LIMITER = get_rate_limiter("api.patentsview.org", capacity=30, refill_per_sec=0.5)
+
+# (company_id, start date, end date) -> (fetched at, raw data), LRU-ordered.
+# Grants publish weekly at most; re-running the pipeline within a few hours
+# should not hit USPTO again for the same company and window
+_FETCH_CACHE: "OrderedDict[Tuple[str, str, str], Tuple[float, Dict[str, Any]]]" = OrderedDict()
+_FETCH_CACHE_MAXSIZE = 256
+_FETCH_CACHE_TTL_SECONDS = 6 * 3600.0
+
+
+def _get_cached_fetch(cache_key: Tuple[str, str, str]) -> Optional[Dict[str, Any]]:
+    """Return a copy of a fresh cached fetch result, or None"""
+    cached = _FETCH_CACHE.get(cache_key)
+    if cached is None:
+        return None
+    fetched_at, cached_data = cached
+    if time.monotonic() - fetched_at >= _FETCH_CACHE_TTL_SECONDS:
+        del _FETCH_CACHE[cache_key]
+        return None
+    _FETCH_CACHE.move_to_end(cache_key)
+    # Callers may mutate what they get; the cached entry must stay pristine
+    return copy.deepcopy(cached_data)
+
+
+def _store_fetch(cache_key: Tuple[str, str, str], fetched_at: float, result: Dict[str, Any]) -> None:
+    """Cache a copy of a fetch result, evicting the least recently used"""
+    _FETCH_CACHE[cache_key] = (fetched_at, copy.deepcopy(result))
+    _FETCH_CACHE.move_to_end(cache_key)
+    if len(_FETCH_CACHE) > _FETCH_CACHE_MAXSIZE:
+        _FETCH_CACHE.popitem(last=False)
 
 
 class PatentFilingsProcessor(SignalProcessor):
     """Track patent filings and grants as innovation signal"""
 
+    # Built once at import; metadata is read per signal in process()
+    _METADATA = SignalProcessorMetadata(
+        signal_type="patent_filings",
+        category=SignalCategory.ALTERNATIVE,
+        description="Patent filings and grants - R&D activity and innovation tracking",
+        update_frequency=UpdateFrequency.MONTHLY,
+        data_source="USPTO PatentsView API",
+        cost=DataCost.FREE,
+        difficulty=Difficulty.MEDIUM,
+        tags=["patents", "innovation", "r&d", "alternative"],
+    )
+
+    # Canonicalizing + hashing the payload is CPU work; keep it off the loop
+    offload_process = True
+
     # High-value technology categories (CPC codes)
     HOT_TECH_AREAS = {
         "G06N": "Artificial Intelligence / Machine Learning",
@@ -67,6 +122,37 @@ class PatentFilingsProcessor(SignalProcessor):
         "C12N": "Genetic Engineering",
     }
 
+    # Only the fields process() reads (plus the number as an id);
+    # titles and assignee names were most of the payload
+    QUERY_FIELDS = [
+        "patent_number",
+        "patent_type",
+        "cpc_section_id",
+        "cited_patent_count",
+    ]
+
+    # Batched queries also need the assignee to route patents back
+    BATCH_QUERY_FIELDS = QUERY_FIELDS + ["assignee_organization"]
+
+    # All hot prefixes as one anchored alternation (longest first), so each
+    # CPC code is checked with a single C-level match call
+    _HOT_TECH_RE = re.compile(
+        "(?:" + "|".join(map(re.escape, sorted(HOT_TECH_AREAS, key=len, reverse=True))) + ")",
+        re.ASCII,
+    )
+
+    # Shared across instances, one per event loop: a pooled client, and a
+    # cap on in-flight PatentsView requests when fetching many companies
+    _clients: LoopLocal[httpx.AsyncClient] = LoopLocal(
+        lambda: httpx.AsyncClient(
+            http2=True,
+            # Fail fast on a dead host; the pool stays warm between fetches
+            timeout=httpx.Timeout(30.0, connect=5.0),
+            limits=httpx.Limits(max_connections=50, max_keepalive_connections=20),
+        )
+    )
+    _sems: LoopLocal[asyncio.Semaphore] = LoopLocal(lambda: asyncio.Semaphore(10))
+
     def __init__(self):
         """Initialize processor."""
         self.api_url = "https://api.patentsview.org/patents/query"
@@ -80,23 +166,72 @@ class PatentFilingsProcessor(SignalProcessor):
             "TSLA": ["Tesla, Inc.", "Tesla Motors, Inc."],
         }
 
+    @classmethod
+    def _get_client(cls) -> httpx.AsyncClient:
+        """Return the running loop's shared HTTP client, creating it on first use"""
+        client = cls._clients.get()
+        if client.is_closed:
+            cls._clients.pop()
+            client = cls._clients.get()
+        return client
+
+    @classmethod
+    async def aclose(cls) -> None:
+        """Close the running loop's shared HTTP client"""
+        client = cls._clients.pop()
+        if client is not None:
+            await client.aclose()
+
     @property
     def metadata(self) -> SignalProcessorMetadata:
-        return SignalProcessorMetadata(
-            signal_type="patent_filings",
-            category=SignalCategory.ALTERNATIVE,
-            description="Patent filings and grants - R&D activity and innovation tracking",
-            update_frequency=UpdateFrequency.MONTHLY,
-            data_source="USPTO PatentsView API",
-            cost=DataCost.FREE,
-            difficulty=Difficulty.MEDIUM,
-            tags=["patents", "innovation", "r&d", "alternative"],
-        )
+        return self._METADATA
 
     def is_applicable(self, company: Company) -> bool:
         """Applicable to companies with R&D activity (tech, pharma, manufacturing)"""
         return company.id in self.assignee_mappings
 
+    @staticmethod
+    def _build_params(
+        assignee_names: List[str],
+        fields: List[str],
+        per_page: int
+    ) -> Dict[str, str]:
+        """
+        Build PatentsView query params matching any of the assignee names.
+
+        Sent as JSON-encoded GET params rather than a POST body: identical
+        queries are then cacheable by any HTTP cache between us and USPTO.
+        """
+        query = {
+            "q": {
+                "_or": [
+                    {"assignee_organization": name}
+                    for name in assignee_names
+                ]
+            },
+            "f": fields,
+            "o": {
+                "per_page": per_page
+            }
+        }
+        return {key: orjson.dumps(value).decode() for key, value in query.items()}
+
+    async def _query(
+        self,
+        assignee_names: List[str],
+        fields: List[str],
+        per_page: int
+    ) -> httpx.Response:
+        """Run one rate-limited PatentsView query; raises httpx.HTTPError on failure"""
+        params = self._build_params(assignee_names, fields, per_page)
+
+        # PatentsView free tier: ~30 requests per minute - pace up front
+        # rather than discovering the limit through 429s; any that still
+        # slip through are retried after the server's Retry-After
+        async with self._sems.get():
+            await _PATENTSVIEW_LIMITER.acquire()
+            return await get_with_retry(self._get_client(), self.api_url, params=params)
+
     async def fetch(
         self,
         company: Company,
@@ -111,52 +246,36 @@ class PatentFilingsProcessor(SignalProcessor):
         if company.id not in self.assignee_mappings:
             return {}
 
-        assignee_names = self.assignee_mappings[company.id]
+        cache_key = (company.id, start.date().isoformat(), end.date().isoformat())
+        cached = _get_cached_fetch(cache_key)
+        if cached is not None:
+            return cached
 
-        # PatentsView API query
-        # Search for patents granted in the date range
-        query = {
-            "q": {
-                "_or": [
-                    {"assignee_organization": name}
-                    for name in assignee_names
-                ]
-            },
-            "f": [
-                "patent_number",
-                "patent_title",
-                "patent_date",
-                "patent_type",
-                "assignee_organization",
-                "cpc_section_id",
-                "cited_patent_count",
-            ],
-            "o": {
-                "per_page": 100
-            }
-        }
+        assignee_names = self.assignee_mappings[company.id]
 
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                logger.info(f"Fetching patent data for {company.ticker} from USPTO")
+            logger.info(f"Fetching patent data for {company.ticker} from USPTO")
 
-                # Note: PatentsView API has rate limits
-                # Free tier: ~30 requests per minute
-                response = await client.post(self.api_url, json=query)
-                response.raise_for_status()
+            response = await self._query(assignee_names, self.QUERY_FIELDS, per_page=100)
 
-                data = response.json()
-                patents = data.get("patents", [])
+            data = orjson.loads(response.content)
+            patents = data.get("patents", [])
 
-                logger.info(f"Found {len(patents)} recent patents for {company.ticker}")
+            logger.info(f"Found {len(patents)} recent patents for {company.ticker}")
 
-                return {
-                    "company_id": company.id,
-                    "ticker": company.ticker,
-                    "patents": patents,
-                    "total_count": data.get("total_patent_count", len(patents)),
-                    "timestamp": datetime.utcnow(),
-                }
+            result = {
+                "company_id": company.id,
+                "ticker": company.ticker,
+                "patents": patents,
+                "total_count": data.get("total_patent_count", len(patents)),
+                # Same digest as fetch_batch(), so both paths share _FETCH_CACHE
+                "raw_hash": hash_payload(patents),
+                "timestamp": datetime.utcnow(),
+            }
+
+            # Only real API responses are cached; sample fallbacks are not
+            _store_fetch(cache_key, time.monotonic(), result)
+            return result
 
         except httpx.HTTPError as e:
             logger.error(f"Error fetching patent data: {e}")
@@ -167,6 +286,121 @@ class PatentFilingsProcessor(SignalProcessor):
             logger.error(f"Unexpected error fetching patents: {e}")
             return {}
 
+    async def fetch_many(
+        self,
+        companies: List[Company],
+        start: datetime,
+        end: datetime
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch patent data for several companies concurrently.
+
+        Requests share the pooled client and are bounded by the class
+        semaphore. A company whose fetch raised maps to an empty dict.
+
+        Returns:
+            Dict of company_id -> raw data (same shape as fetch())
+        """
+        results = await asyncio.gather(
+            *(self.fetch(company, start, end) for company in companies),
+            return_exceptions=True,
+        )
+
+        raw_by_company = {}
+        for company, result in zip(companies, results):
+            if isinstance(result, BaseException):
+                logger.error(f"Error fetching patents for {company.ticker}: {result}")
+                result = {}
+            raw_by_company[company.id] = result
+        return raw_by_company
+
+    async def fetch_batch(
+        self,
+        companies: List[Company],
+        start: datetime,
+        end: datetime
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch patent data for several companies with a single query.
+
+        All assignee aliases go into one `_or` query and the returned
+        patents are routed back to companies by assignee organization. On
+        HTTP errors each company falls back to its sample data, as in fetch().
+
+        Returns:
+            Dict of company_id -> raw data (same shape as fetch())
+        """
+        companies = [c for c in companies if c.id in self.assignee_mappings]
+        if not companies:
+            return {}
+
+        company_by_assignee = {
+            name: company.id
+            for company in companies
+            for name in self.assignee_mappings[company.id]
+        }
+        # Same page budget per company as a single fetch(), within the API max
+        per_page = min(10000, 100 * len(companies))
+
+        try:
+            logger.info(f"Fetching patent data for {len(companies)} companies from USPTO")
+
+            response = await self._query(
+                list(company_by_assignee), self.BATCH_QUERY_FIELDS, per_page
+            )
+            data = orjson.loads(response.content)
+        except httpx.HTTPError as e:
+            logger.error(f"Error fetching patent data: {e}")
+            logger.warning("Using sample patent data")
+            return {
+                company.id: self._get_sample_data(company, start, end)
+                for company in companies
+            }
+        except Exception as e:
+            logger.error(f"Unexpected error fetching patents: {e}")
+            return {company.id: {} for company in companies}
+
+        patents_by_company: Dict[str, List[Dict[str, Any]]] = {
+            company.id: [] for company in companies
+        }
+        for patent in data.get("patents", []):
+            # Assignees come back nested; a co-assigned patent counts for each
+            assignees = patent.get("assignees") or [patent]
+            matched = {
+                company_by_assignee.get(assignee.get("assignee_organization"))
+                for assignee in assignees
+            }
+            matched.discard(None)
+            if not matched:
+                continue
+            # Drop the routing-only assignee data so each company gets the
+            # same patent shape (and raw_hash) a single fetch() would
+            trimmed = {field: patent[field] for field in self.QUERY_FIELDS if field in patent}
+            for company_id in matched:
+                patents_by_company[company_id].append(trimmed)
+
+        now = datetime.utcnow()
+        fetched_at = time.monotonic()
+        date_range = (start.date().isoformat(), end.date().isoformat())
+
+        raw_by_company = {}
+        for company in companies:
+            patents = patents_by_company[company.id]
+            logger.info(f"Found {len(patents)} recent patents for {company.ticker}")
+
+            result = {
+                "company_id": company.id,
+                "ticker": company.ticker,
+                "patents": patents,
+                "total_count": len(patents),
+                "raw_hash": hash_payload(patents),
+                "timestamp": now,
+            }
+            _store_fetch((company.id, *date_range), fetched_at, result)
+            raw_by_company[company.id] = result
+
+        return raw_by_company
+
     def process(self, company: Company, raw_data: Dict[str, Any]) -> List[Signal]:
         """
         Process patent data into signals.
@@ -180,31 +414,29 @@ class PatentFilingsProcessor(SignalProcessor):
         if not patents:
             return []
 
+        md = self._METADATA
         total_count = len(patents)
 
+        # fetch() hashes the response bytes; only hand-built raw data lacks it
+        raw_hash = raw_data.get("raw_hash") or hash_payload(patents)
+
         # Analyze patents
         high_citation_count = 0
         hot_tech_count = 0
         utility_patent_count = 0
 
+        is_hot = self._HOT_TECH_RE.match
+        get = dict.get
+
         for patent in patents:
-            # Check patent type
-            patent_type = patent.get("patent_type", "")
-            if patent_type == "utility":
-                utility_patent_count += 1
-
-            # Check citations (quality indicator)
-            citations = patent.get("cited_patent_count", 0)
-            if citations > 10:  # Well-cited patent
-                high_citation_count += 1
-
-            # Check if in hot tech area
-            cpc_codes = patent.get("cpc_section_id", [])
-            if isinstance(cpc_codes, list):
-                for code in cpc_codes:
-                    if any(code.startswith(hot) for hot in self.HOT_TECH_AREAS.keys()):
-                        hot_tech_count += 1
-                        break
+            # Booleans add as 0/1, so the counters need no branches
+            utility_patent_count += get(patent, "patent_type", "") == "utility"
+            high_citation_count += get(patent, "cited_patent_count", 0) > 10  # Well-cited patent
+
+            # Check if in hot tech area (any sequence of codes, not a bare string)
+            cpc_codes = get(patent, "cpc_section_id") or ()
+            if not isinstance(cpc_codes, str):
+                hot_tech_count += any(map(is_hot, cpc_codes))
 
         # Calculate score
         # Base: +2 per patent
@@ -234,8 +466,8 @@ class PatentFilingsProcessor(SignalProcessor):
 
         signal = Signal(
             company_id=company.id,
-            signal_type=self.metadata.signal_type,
-            category=self.metadata.category,
+            signal_type=md.signal_type,
+            category=md.category,
             timestamp=datetime.utcnow(),
             raw_value={
                 "total_patents": total_count,
@@ -250,9 +482,7 @@ class PatentFilingsProcessor(SignalProcessor):
                 source_url="https://patentsview.org",
                 source_name="USPTO PatentsView",
                 processing_notes=f"Analyzed {total_count} patent grants",
-                raw_data_hash=hashlib.md5(
-                    json.dumps(patents, sort_keys=True, default=str).encode()
-                ).hexdigest(),
+                raw_data_hash=raw_hash,
             ),
             description=description,
             tags=["patents", "innovation", "r&d"],
@@ -314,5 +544,6 @@ class PatentFilingsProcessor(SignalProcessor):
             "ticker": company.ticker,
             "patents": sample_patents,
             "total_count": len(sample_patents),
+            "raw_hash": hash_payload(sample_patents),
             "timestamp": datetime.utcnow(),
         }
@@ -40,11 +40,11 @@ Data Sources:
 Update Frequency: Daily
 """
 
-from typing import List, Any, Dict, Optional
-from datetime import datetime, timedelta
-import hashlib
-import json
+from typing import List, Any, Dict, Optional, Tuple, cast
+from datetime import datetime
+from functools import lru_cache
 
+import numpy as np
 from loguru import logger
 
 from ...core.signal_processor import (
@@ -56,11 +56,86 @@ from ...core.signal_processor import (
 )
 from ...core.signal import Signal, SignalCategory, SignalMetadata
 from ...core.company import Company
+from ...core.hashing import hash_payload
+
+
+_PRICE_UP_NOTE = "📈 Price increase (strong demand/pricing power)"
+_PRICE_DOWN_NOTE = "📉 Price decrease (competition/weak demand)"
+
+
+def _display_name(product: str) -> str:
+    """Human-readable product name, e.g. base_fare_uberx -> Base Fare Uberx"""
+    return product.replace("_", " ").title()
+
+
+def _to_series(snapshots: List[Tuple[str, float, Dict[str, float]]]) -> Dict[str, Any]:
+    """
+    Convert [(date, price, competitors), ...] into column arrays, newest first.
+
+    Returns:
+        Dict with "dates" (datetime64[D]), "prices" (float64), "competitors"
+        ({name: float64 prices, NaN where not tracked}), "hash" (raw data
+        hash of the date-sorted snapshots) and "latest_at" (newest date)
+    """
+    ordered = sorted(snapshots, key=lambda x: x[0], reverse=True)
+    names = dict.fromkeys(name for _, _, competitors in ordered for name in competitors)
+
+    return {
+        "dates": np.array([date for date, _, _ in ordered], dtype="datetime64[D]"),
+        "prices": np.array([price for _, price, _ in ordered], dtype=np.float64),
+        "competitors": {
+            name: np.array(
+                [competitors.get(name, np.nan) for _, _, competitors in ordered],
+                dtype=np.float64,
+            )
+            for name in names
+        },
+        "hash": hash_payload(ordered),
+        # Parsed once here; it becomes the signal timestamp
+        "latest_at": datetime.fromisoformat(ordered[0][0]) if ordered else None,
+    }
+
+
+@lru_cache(maxsize=256)
+def _cached_series(
+    frozen: Tuple[Tuple[str, float, Tuple[Tuple[str, float], ...]], ...]
+) -> Dict[str, Any]:
+    """_to_series() memoized on a hashable copy of one product's snapshots"""
+    return _to_series([(date, price, dict(competitors)) for date, price, competitors in frozen])
+
+
+def _product_series(snapshots: List[Tuple[str, float, Dict[str, float]]]) -> Dict[str, Any]:
+    """
+    Column arrays for one product's snapshots, reused while they are unchanged.
+
+    Rows may be tuples or JSON-decoded lists; either way they are frozen into
+    tuples so the sort, array build and hash only run for new histories.
+    """
+    frozen = tuple(
+        (date, price, tuple(competitors.items()))
+        for date, price, competitors in snapshots
+    )
+    return _cached_series(frozen)
 
 
 class PricingIntelligenceProcessor(SignalProcessor):
     """Track product/service pricing changes"""
 
+    # Built once at import; metadata is read per signal in process()
+    _METADATA = SignalProcessorMetadata(
+        signal_type="pricing_intelligence",
+        category=SignalCategory.ALTERNATIVE,
+        description="Product/service pricing tracking - pricing power and competitive positioning",
+        update_frequency=UpdateFrequency.DAILY,
+        data_source="Web scraping / Manual tracking",
+        cost=DataCost.FREE,
+        difficulty=Difficulty.MEDIUM,
+        tags=["pricing", "competitive_intelligence", "demand"],
+    )
+
+    # Canonicalizing + hashing the payload is CPU work; keep it off the loop
+    offload_process = True
+
     def __init__(self):
         """Initialize processor."""
         # Manual price tracking
@@ -80,19 +155,15 @@ class PricingIntelligenceProcessor(SignalProcessor):
                 ],
             },
         }
+        self._display_names = {
+            product: _display_name(product)
+            for products in self.pricing_snapshots.values()
+            for product in products
+        }
 
     @property
     def metadata(self) -> SignalProcessorMetadata:
-        return SignalProcessorMetadata(
-            signal_type="pricing_intelligence",
-            category=SignalCategory.ALTERNATIVE,
-            description="Product/service pricing tracking - pricing power and competitive positioning",
-            update_frequency=UpdateFrequency.DAILY,
-            data_source="Web scraping / Manual tracking",
-            cost=DataCost.FREE,
-            difficulty=Difficulty.MEDIUM,
-            tags=["pricing", "competitive_intelligence", "demand"],
-        )
+        return self._METADATA
 
     def is_applicable(self, company: Company) -> bool:
         """Applicable to companies with trackable pricing"""
@@ -134,17 +205,25 @@ class PricingIntelligenceProcessor(SignalProcessor):
         if not products:
             return []
 
-        signals = []
-
+        # First pass: per-product price change and competitor positioning.
+        # Snapshots become newest-first column arrays here rather than in
+        # fetch(), so raw_data stays plain, serializable records.
+        rows = []
         for product_name, snapshots in products.items():
             if len(snapshots) < 2:
                 continue
 
-            # Sort by date (newest first)
-            snapshots = sorted(snapshots, key=lambda x: x[0], reverse=True)
+            series = _product_series(snapshots)
+            prices = series["prices"]
 
-            latest_date, latest_price, latest_competitors = snapshots[0]
-            prev_date, prev_price, prev_competitors = snapshots[1]
+            # Columns are pre-sorted newest first: [0] = latest, [1] = previous
+            latest_price = float(prices[0])
+            prev_price = float(prices[1])
+            latest_competitors = {
+                name: float(competitor_prices[0])
+                for name, competitor_prices in series["competitors"].items()
+                if not np.isnan(competitor_prices[0])
+            }
 
             # Calculate price change
             price_change = latest_price - prev_price
@@ -152,66 +231,93 @@ class PricingIntelligenceProcessor(SignalProcessor):
 
             # Calculate competitor positioning
             if latest_competitors:
-                competitor_prices = list(latest_competitors.values())
-                avg_competitor_price = sum(competitor_prices) / len(competitor_prices)
+                avg_competitor_price = float(np.mean(list(latest_competitors.values())))
                 price_premium = ((latest_price - avg_competitor_price) / avg_competitor_price * 100) if avg_competitor_price > 0 else 0
             else:
                 avg_competitor_price = 0
                 price_premium = 0
 
-            # Calculate score
-            # Price increase component
-            if price_change_pct > 5:
-                # Significant price increase = strong pricing power
-                price_change_score = min(40, 20 + price_change_pct * 2)
-            elif price_change_pct > 0:
-                # Small increase = moderate pricing power
-                price_change_score = price_change_pct * 4
-            elif price_change_pct > -5:
-                # Small decrease = slight weakness
-                price_change_score = price_change_pct * 3
-            else:
-                # Large decrease = competitive pressure
-                price_change_score = max(-40, -20 + price_change_pct * 2)
-
-            # Competitive positioning component
-            if price_premium > 10:
-                # Premium pricing = brand strength (if sustainable)
-                positioning_score = 20
-            elif price_premium > 0:
-                # Slight premium = good positioning
-                positioning_score = 10
-            elif price_premium > -10:
-                # Parity pricing = neutral
-                positioning_score = 0
-            else:
-                # Discount pricing = weak positioning
-                positioning_score = -15
+            rows.append((
+                product_name,
+                series,
+                latest_price,
+                latest_competitors,
+                avg_competitor_price,
+                price_change_pct,
+                price_premium,
+            ))
+
+        if not rows:
+            return []
 
-            total_score = int(price_change_score + positioning_score)
-            total_score = max(-100, min(100, total_score))
+        # Score every product at once
+        pcts = np.array([row[5] for row in rows], dtype=np.float64)
+        premiums = np.array([row[6] for row in rows], dtype=np.float64)
+
+        # Price change component:
+        #   > +5%  significant increase = strong pricing power (capped at 40)
+        #   0..5%  small increase = moderate pricing power
+        #   -5..0% small decrease = slight weakness
+        #   < -5%  large decrease = competitive pressure (floored at -40)
+        price_change_scores = np.select(
+            [pcts > 5, pcts > 0, pcts > -5],
+            [np.minimum(40, 20 + pcts * 2), pcts * 4, pcts * 3],
+            np.maximum(-40, -20 + pcts * 2),
+        )
+
+        # Competitive positioning component:
+        #   > +10% premium = brand strength, 0..10% slight premium = good,
+        #   -10..0% parity = neutral, below that discount = weak positioning
+        positioning_scores = np.select(
+            [premiums > 10, premiums > 0, premiums > -10],
+            [20, 10, 0],
+            -15,
+        )
+
+        total_scores = np.clip(
+            (price_change_scores + positioning_scores).astype(np.int64), -100, 100
+        )
+
+        # Second pass: build signals from the scored rows (exactly one per row)
+        md = self._METADATA
+        display_names = self._display_names
+        # Every row yields exactly one signal, so size the list up front and
+        # fill it by index rather than growing it with append()
+        signals: List[Optional[Signal]] = [None] * len(rows)
+
+        for idx, (row, total_score) in enumerate(zip(rows, total_scores.tolist())):
+            (
+                product_name,
+                series,
+                latest_price,
+                latest_competitors,
+                avg_competitor_price,
+                price_change_pct,
+                price_premium,
+            ) = row
 
             # Confidence
             confidence = 0.70
 
             # Build description
-            product_display = product_name.replace("_", " ").title()
-            description = f"{product_display}: ${latest_price:.2f} ({price_change_pct:+.1f}%)"
+            product_display = display_names.get(product_name) or _display_name(product_name)
+            parts = [f"{product_display}: ${latest_price:.2f} ({price_change_pct:+.1f}%)"]
 
             if price_change_pct > 0:
-                description += " | 📈 Price increase (strong demand/pricing power)"
+                parts.append(_PRICE_UP_NOTE)
             elif price_change_pct < 0:
-                description += " | 📉 Price decrease (competition/weak demand)"
+                parts.append(_PRICE_DOWN_NOTE)
 
             if latest_competitors:
-                comp_names = list(latest_competitors.keys())
-                description += f" | vs {', '.join(comp_names)}: {price_premium:+.0f}%"
+                parts.append(f"vs {', '.join(latest_competitors)}: {price_premium:+.0f}%")
+
+            description = " | ".join(parts)
 
             signal = Signal(
                 company_id=company.id,
-                signal_type=f"{self.metadata.signal_type}_{product_name}",
-                category=self.metadata.category,
-                timestamp=datetime.fromisoformat(latest_date),
+                signal_type=f"{md.signal_type}_{product_name}",
+                category=md.category,
+                timestamp=series["latest_at"],
                 raw_value={
                     "product": product_name,
                     "current_price": latest_price,
@@ -226,14 +332,12 @@ class PricingIntelligenceProcessor(SignalProcessor):
                     source_url=f"https://www.{company.name.lower().replace(' ', '')}.com",
                     source_name="Pricing Intelligence",
                     processing_notes=f"{price_change_pct:+.1f}% price change, {price_premium:+.0f}% vs competitors",
-                    raw_data_hash=hashlib.md5(
-                        json.dumps(snapshots, sort_keys=True, default=str).encode()
-                    ).hexdigest(),
+                    raw_data_hash=series["hash"],
                 ),
                 description=description,
                 tags=["pricing", "competitive_intelligence", product_name],
             )
 
-            signals.append(signal)
+            signals[idx] = signal
 
-        return signals
+        return cast(List[Signal], signals)
@@ -8,14 +8,16 @@ Data Source: Reddit (free, public)
 Update Frequency: Real-time
 """
 
-from typing import List, Any, Dict, Optional
-from datetime import datetime, timedelta
+from typing import List, Any, Dict
+from bisect import bisect_right
+from datetime import datetime
+from itertools import accumulate
 import asyncio
-import hashlib
-import json
 import re
 
 import httpx
+import numpy as np
+import orjson
 from loguru import logger
 
 from ...core.signal_processor import (
@@ -27,23 +29,79 @@ from ...core.signal_processor import (
 )
 from ...core.signal import Signal, SignalCategory, SignalMetadata
 from ...core.company import Company
+from ...core.hashing import hash_items
+from ...core.loop_local import LoopLocal
+from ...core.rate_limiter import get_rate_limiter
+
+
+# Shared by every processor instance: at most 8 subreddit searches in
+# flight (per event loop), paced at ~1 request/second with a small burst
+_REDDIT_SEMAPHORES: LoopLocal[asyncio.Semaphore] = LoopLocal(lambda: asyncio.Semaphore(8))
+_REDDIT_LIMITER = get_rate_limiter("www.reddit.com", capacity=4, refill_per_sec=1.0)
+
+
+def _permalink(post: Dict[str, Any]) -> str:
+    return post.get('permalink', '')
 
 
 class RedditSentimentProcessor(SignalProcessor):
     """Process Reddit mentions and sentiment"""
 
-    def __init__(self):
-        # Subreddits to monitor per company
-        self.subreddits = {
-            "UBER": ["uber", "uberdrivers", "UberEATS", "stocks", "investing"],
-            "LYFT": ["lyft", "lyftdrivers", "stocks", "investing"],
-        }
+    POSITIVE_KEYWORDS = frozenset(['buy', 'bullish', 'moon', 'calls', 'growth', 'good', 'great', 'excellent', 'profitable'])
+    NEGATIVE_KEYWORDS = frozenset(['sell', 'bearish', 'crash', 'puts', 'decline', 'bad', 'terrible', 'loss', 'unprofitable'])
+
+    # Every sentiment keyword in one word-bounded alternation, so "good"
+    # no longer fires inside "goodbye" nor "profitable" inside
+    # "unprofitable". Compiled once at import and shared by all instances.
+    _KEYWORD_RE = re.compile(
+        r"\b(?:"
+        + "|".join(map(re.escape, sorted(POSITIVE_KEYWORDS | NEGATIVE_KEYWORDS, key=len, reverse=True)))
+        + r")\b"
+    )
+
+    # Subreddits to monitor per company
+    SUBREDDITS = {
+        "UBER": ["uber", "uberdrivers", "UberEATS", "stocks", "investing"],
+        "LYFT": ["lyft", "lyftdrivers", "stocks", "investing"],
+    }
+
+    # Keywords to search for
+    SEARCH_KEYWORDS = {
+        "UBER": ["uber", "uber stock", "uber eats", "dara khosrowshahi"],
+        "LYFT": ["lyft", "lyft stock", "david risher"],
+    }
+
+    # One pooled HTTP/2 client per event loop, shared by all instances;
+    # concurrent subreddit searches multiplex over the same connection
+    _clients: LoopLocal[httpx.AsyncClient] = LoopLocal(
+        lambda: httpx.AsyncClient(
+            http2=True,
+            timeout=30.0,
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=32),
+            headers={'User-Agent': 'cousin-eddie/0.1 (Alternative Data Research)'},
+        )
+    )
 
-        # Keywords to search for
-        self.keywords = {
-            "UBER": ["uber", "uber stock", "uber eats", "dara khosrowshahi"],
-            "LYFT": ["lyft", "lyft stock", "david risher"],
-        }
+    def __init__(self):
+        # Static config lives on the class; instances just reference it
+        self.subreddits = self.SUBREDDITS
+        self.keywords = self.SEARCH_KEYWORDS
+
+    @classmethod
+    def _get_client(cls) -> httpx.AsyncClient:
+        """Return the running loop's shared HTTP client, creating it on first use"""
+        client = cls._clients.get()
+        if client.is_closed:
+            cls._clients.pop()
+            client = cls._clients.get()
+        return client
+
+    @classmethod
+    async def aclose(cls) -> None:
+        """Close the running loop's shared HTTP client"""
+        client = cls._clients.pop()
+        if client is not None:
+            await client.aclose()
 
     @property
     def metadata(self) -> SignalProcessorMetadata:
@@ -77,61 +135,25 @@ class RedditSentimentProcessor(SignalProcessor):
         subreddits = self.subreddits.get(company.id, ["stocks", "investing"])
         keywords = self.keywords.get(company.id, [company.ticker.lower()])
 
-        all_posts = []
+        query = keywords[0]  # Use first keyword
+
+        # All subreddits in flight at once; the semaphore and the shared
+        # reddit.com token bucket keep us polite instead of a fixed sleep
+        client = self._get_client()
+        results = await asyncio.gather(
+            *(
+                self._fetch_subreddit(client, subreddit, query, start, end)
+                for subreddit in subreddits
+            ),
+            return_exceptions=True,
+        )
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            for subreddit in subreddits:
-                try:
-                    # Reddit JSON API
-                    url = f"https://www.reddit.com/r/{subreddit}/search.json"
-                    params = {
-                        'q': keywords[0],  # Use first keyword
-                        'restrict_sr': 'true',
-                        'sort': 'new',
-                        'limit': 25,
-                        't': 'week'  # Last week
-                    }
-
-                    logger.info(f"Fetching Reddit posts from r/{subreddit} for {keywords[0]}")
-
-                    headers = {
-                        'User-Agent': 'cousin-eddie/0.1 (Alternative Data Research)'
-                    }
-
-                    response = await client.get(url, params=params, headers=headers)
-
-                    if response.status_code == 200:
-                        data = response.json()
-                        posts = data.get('data', {}).get('children', [])
-
-                        for post in posts:
-                            post_data = post.get('data', {})
-                            created_utc = datetime.fromtimestamp(post_data.get('created_utc', 0))
-
-                            # Only include posts in our date range
-                            if start <= created_utc <= end:
-                                all_posts.append({
-                                    'subreddit': subreddit,
-                                    'title': post_data.get('title', ''),
-                                    'selftext': post_data.get('selftext', '')[:500],  # Limit text
-                                    'score': post_data.get('score', 0),
-                                    'num_comments': post_data.get('num_comments', 0),
-                                    'upvote_ratio': post_data.get('upvote_ratio', 0.5),
-                                    'created_utc': created_utc.isoformat(),
-                                    'author': post_data.get('author', 'deleted'),
-                                    'url': post_data.get('url', ''),
-                                    'permalink': f"https://reddit.com{post_data.get('permalink', '')}",
-                                })
-
-                        logger.info(f"Found {len(posts)} posts in r/{subreddit}")
-                    else:
-                        logger.warning(f"Reddit API error for r/{subreddit}: HTTP {response.status_code}")
-
-                    # Rate limit: be nice to Reddit
-                    await asyncio.sleep(1)
-
-                except Exception as e:
-                    logger.error(f"Error fetching Reddit data from r/{subreddit}: {e}")
+        all_posts = []
+        for subreddit, result in zip(subreddits, results):
+            if isinstance(result, BaseException):
+                logger.error(f"Error fetching Reddit data from r/{subreddit}: {result}")
+                continue
+            all_posts.extend(result)
 
         logger.info(f"Total Reddit posts found: {len(all_posts)}")
 
@@ -144,6 +166,74 @@ class RedditSentimentProcessor(SignalProcessor):
             'total_posts': len(all_posts)
         }
 
+    async def _fetch_subreddit(
+        self,
+        client: httpx.AsyncClient,
+        subreddit: str,
+        query: str,
+        start: datetime,
+        end: datetime
+    ) -> List[Dict[str, Any]]:
+        """Search one subreddit and return posts within [start, end]"""
+        # Reddit JSON API
+        url = f"https://www.reddit.com/r/{subreddit}/search.json"
+        params = {
+            'q': query,
+            'restrict_sr': 'true',
+            'sort': 'new',
+            'limit': 25,
+            't': 'week'  # Last week
+        }
+
+        logger.info(f"Fetching Reddit posts from r/{subreddit} for {query}")
+
+        async with _REDDIT_SEMAPHORES.get():
+            await _REDDIT_LIMITER.acquire()
+            response = await client.get(url, params=params)
+
+        # Reddit reports the remaining quota; once it runs out, pause the
+        # shared limiter so no caller sends another request before the reset
+        remaining = response.headers.get('X-Ratelimit-Remaining')
+        reset = response.headers.get('X-Ratelimit-Reset')
+        if remaining is not None and reset is not None and float(remaining) < 1:
+            logger.warning(f"Reddit rate limit exhausted - backing off {float(reset):.0f}s")
+            _REDDIT_LIMITER.backoff(float(reset))
+
+        if response.status_code != 200:
+            logger.warning(f"Reddit API error for r/{subreddit}: HTTP {response.status_code}")
+            return []
+
+        data = orjson.loads(response.content)
+        posts = (data.get('data') or {}).get('children', [])
+
+        # Compare raw epoch seconds; only posts that pass get a datetime.
+        # Naive start/end are local time, matching datetime.fromtimestamp.
+        start_ts, end_ts = start.timestamp(), end.timestamp()
+
+        subreddit_posts = []
+        for post in posts:
+            post_data = post.get('data', {})
+            created_ts = post_data.get('created_utc', 0)
+
+            # Only include posts in our date range
+            if start_ts <= created_ts <= end_ts:
+                created_utc = datetime.fromtimestamp(created_ts)
+                subreddit_posts.append({
+                    'subreddit': subreddit,
+                    'title': post_data.get('title', ''),
+                    'selftext': post_data.get('selftext', '')[:500],  # Limit text
+                    'score': post_data.get('score', 0),
+                    'num_comments': post_data.get('num_comments', 0),
+                    'upvote_ratio': post_data.get('upvote_ratio', 0.5),
+                    'created_utc': created_utc.isoformat(),
+                    'author': post_data.get('author', 'deleted'),
+                    'url': post_data.get('url', ''),
+                    'permalink': f"https://reddit.com{post_data.get('permalink', '')}",
+                })
+
+        logger.info(f"Found {len(posts)} posts in r/{subreddit}")
+        return subreddit_posts
+
     def process(
         self,
         company: Company,
@@ -166,21 +256,28 @@ class RedditSentimentProcessor(SignalProcessor):
 
         # Calculate metrics
         total_posts = len(posts)
-        total_score = sum(p.get('score', 0) for p in posts)
-        total_comments = sum(p.get('num_comments', 0) for p in posts)
-        avg_upvote_ratio = sum(p.get('upvote_ratio', 0.5) for p in posts) / total_posts if total_posts > 0 else 0.5
-
-        # Simple sentiment analysis (keyword-based)
-        positive_keywords = ['buy', 'bullish', 'moon', 'calls', 'growth', 'good', 'great', 'excellent', 'profitable']
-        negative_keywords = ['sell', 'bearish', 'crash', 'puts', 'decline', 'bad', 'terrible', 'loss', 'unprofitable']
-
-        positive_count = 0
-        negative_count = 0
+        scores = np.fromiter((p.get('score', 0) for p in posts), dtype=np.int64, count=total_posts)
+        comments = np.fromiter((p.get('num_comments', 0) for p in posts), dtype=np.int64, count=total_posts)
+        upvote_ratios = np.fromiter((p.get('upvote_ratio', 0.5) for p in posts), dtype=np.float64, count=total_posts)
+
+        total_score = int(scores.sum())
+        total_comments = int(comments.sum())
+        avg_upvote_ratio = float(upvote_ratios.mean())
+
+        # Simple sentiment analysis (keyword-based): each post counts every
+        # distinct keyword it mentions. All texts are joined with "\n" (no
+        # keyword contains one) and scanned once; each hit is mapped back to
+        # its post by offset.
+        texts = [(p.get('title', '') + ' ' + p.get('selftext', '')).lower() for p in posts]
+        post_ends = list(accumulate(len(text) + 1 for text in texts))
+        hits = {
+            (bisect_right(post_ends, match.start()), match.group())
+            for match in self._KEYWORD_RE.finditer("\n".join(texts))
+        }
 
-        for post in posts:
-            text = (post.get('title', '') + ' ' + post.get('selftext', '')).lower()
-            positive_count += sum(1 for word in positive_keywords if word in text)
-            negative_count += sum(1 for word in negative_keywords if word in text)
+        positive_keywords = self.POSITIVE_KEYWORDS
+        positive_count = sum(1 for _, keyword in hits if keyword in positive_keywords)
+        negative_count = len(hits) - positive_count
 
         # Calculate sentiment score
         if positive_count + negative_count > 0:
@@ -234,6 +331,10 @@ class RedditSentimentProcessor(SignalProcessor):
 
         normalized_value = score / 100.0
 
+        # Stream the hash post by post in a stable order instead of
+        # encoding the whole batch into one buffer
+        raw_data_hash = hash_items(sorted(posts, key=_permalink))
+
         signal = Signal(
             company_id=company.id,
             signal_type=self.metadata.signal_type,
@@ -256,9 +357,7 @@ class RedditSentimentProcessor(SignalProcessor):
                 source_url="https://reddit.com",
                 source_name="Reddit",
                 processing_notes=f"Analyzed {total_posts} posts across {len(raw_data.get('subreddits', []))} subreddits",
-                raw_data_hash=hashlib.md5(
-                    json.dumps(posts, sort_keys=True, default=str).encode()
-                ).hexdigest(),
+                raw_data_hash=raw_data_hash,
             ),
             description=description,
             tags=["reddit", "social_sentiment", "retail_investors"],
@@ -29,8 +29,6 @@ Difficulty: VERY HARD (requires image processing, ML models)
 
 from typing import List, Any, Dict
 from datetime import datetime
-import hashlib
-import json
 
 from loguru import logger
 
@@ -43,6 +41,7 @@ from ...core.signal_processor import (
 )
 from ...core.signal import Signal, SignalCategory, SignalMetadata
 from ...core.company import Company
+from ...core.hashing import hash_payload
 
 
 class SatelliteImageryProcessor(SignalProcessor):
@@ -135,7 +134,7 @@ class SatelliteImageryProcessor(SignalProcessor):
                 source_url="https://earthengine.google.com",
                 source_name="Satellite Imagery Analysis",
                 processing_notes=f"{analysis_type}: {change_percent:+.1f}% change",
-                raw_data_hash=hashlib.md5(json.dumps(raw_data, sort_keys=True).encode()).hexdigest(),
+                raw_data_hash=hash_payload(raw_data),
             ),
             description=description,
             tags=["satellite", "imagery", analysis_type],
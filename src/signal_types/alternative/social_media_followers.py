@@ -49,11 +49,12 @@ Data Sources:
 Update Frequency: Weekly
 """
 
-from typing import List, Any, Dict, Optional
+from typing import List, Any, Dict, Optional, Tuple, cast
 from datetime import datetime, timedelta
-import hashlib
-import json
+from functools import lru_cache
+from operator import itemgetter
 
+import numpy as np
 from loguru import logger
 
 from ...core.signal_processor import (
@@ -65,43 +66,115 @@ from ...core.signal_processor import (
 )
 from ...core.signal import Signal, SignalCategory, SignalMetadata
 from ...core.company import Company
+from ...core.hashing import hash_payload
+
+
+_snapshot_date = itemgetter(0)
+
+
+@lru_cache(maxsize=1024)
+def _parse_date(date: str) -> datetime:
+    """Parse a snapshot ISO date; the same few dates recur on every run"""
+    return datetime.fromisoformat(date)
+
+
+@lru_cache(maxsize=64)
+def _platform_labels(platform: str) -> Tuple[str, str, Tuple[str, ...]]:
+    """Per-platform display title, source name and tags, built once per platform"""
+    title = platform.title()
+    return title, f"{title} Followers", ("social_media", platform, "follower_growth")
+
+
+@lru_cache(maxsize=256)
+def _hash_snapshots(snapshots: Tuple[Tuple[str, int, float], ...]) -> str:
+    """
+    Hash a platform's date-sorted snapshots.
+
+    Snapshots are hashable tuples that rarely change between runs, so the
+    canonical serialization is done once per distinct history. orjson
+    encodes tuples as arrays, so digests match hashing the list form.
+    """
+    return hash_payload(snapshots)
+
+
+def _score_platforms(
+    latest_followers: np.ndarray,
+    prev_followers: np.ndarray,
+    latest_engagement: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Score every platform at once.
+
+    Returns:
+        (platform scores as int64 clamped to [-100, 100], MoM growth rates in %)
+    """
+    growth_rates = np.divide(
+        latest_followers - prev_followers,
+        prev_followers,
+        out=np.zeros_like(latest_followers),
+        where=prev_followers > 0,
+    ) * 100
+
+    # Growth component
+    growth_scores = np.select(
+        [growth_rates > 5, growth_rates > 0, growth_rates > -2],
+        [np.minimum(60, 40 + growth_rates * 4), growth_rates * 8, growth_rates * 10],
+        np.maximum(-60, -40 + growth_rates * 5),
+    )
+
+    # Engagement component
+    # Good engagement: >3% for most platforms
+    # Average: 1-3%
+    # Poor: <1%
+    engagement_scores = np.select(
+        [latest_engagement > 3, latest_engagement > 1.5, latest_engagement < 0.5],
+        [20, 10, -15],
+        0,
+    )
+
+    platform_scores = np.clip((growth_scores + engagement_scores).astype(np.int64), -100, 100)
+    return platform_scores, growth_rates
 
 
 class SocialMediaFollowersProcessor(SignalProcessor):
     """Track social media follower growth across platforms"""
 
+    # Manual follower tracking
+    # Format: {company_id: {platform: [(date, followers, engagement_rate), ...]}}
+    FOLLOWER_SNAPSHOTS = {
+        "UBER": {
+            "twitter": [
+                ("2026-02-01", 1250000, 2.1),
+                ("2026-01-01", 1235000, 2.0),
+                ("2025-12-01", 1220000, 2.2),
+                ("2025-11-01", 1205000, 2.3),
+            ],
+            "instagram": [
+                ("2026-02-01", 3800000, 3.5),
+                ("2026-01-01", 3720000, 3.4),
+                ("2025-12-01", 3650000, 3.6),
+                ("2025-11-01", 3580000, 3.8),
+            ],
+            "linkedin": [
+                ("2026-02-01", 2100000, 1.5),
+                ("2026-01-01", 2050000, 1.4),
+                ("2025-12-01", 2000000, 1.6),
+                ("2025-11-01", 1950000, 1.5),
+            ],
+            "facebook": [
+                ("2026-02-01", 5200000, 1.8),
+                ("2026-01-01", 5150000, 1.7),
+                ("2025-12-01", 5100000, 1.9),
+                ("2025-11-01", 5050000, 2.0),
+            ],
+        },
+    }
+
     def __init__(self):
         """Initialize processor."""
-        # Manual follower tracking
-        # Format: {company_id: {platform: [(date, followers, engagement_rate), ...]}}
-        self.follower_snapshots = {
-            "UBER": {
-                "twitter": [
-                    ("2026-02-01", 1250000, 2.1),
-                    ("2026-01-01", 1235000, 2.0),
-                    ("2025-12-01", 1220000, 2.2),
-                    ("2025-11-01", 1205000, 2.3),
-                ],
-                "instagram": [
-                    ("2026-02-01", 3800000, 3.5),
-                    ("2026-01-01", 3720000, 3.4),
-                    ("2025-12-01", 3650000, 3.6),
-                    ("2025-11-01", 3580000, 3.8),
-                ],
-                "linkedin": [
-                    ("2026-02-01", 2100000, 1.5),
-                    ("2026-01-01", 2050000, 1.4),
-                    ("2025-12-01", 2000000, 1.6),
-                    ("2025-11-01", 1950000, 1.5),
-                ],
-                "facebook": [
-                    ("2026-02-01", 5200000, 1.8),
-                    ("2026-01-01", 5150000, 1.7),
-                    ("2025-12-01", 5100000, 1.9),
-                    ("2025-11-01", 5050000, 2.0),
-                ],
-            },
-        }
+        # Seed data is static; reference the class constant rather than
+        # rebuilding the nested dicts per instance
+        self.follower_snapshots = self.FOLLOWER_SNAPSHOTS
 
     @property
     def metadata(self) -> SignalProcessorMetadata:
@@ -156,53 +229,51 @@ class SocialMediaFollowersProcessor(SignalProcessor):
         if not platforms:
             return []
 
-        signals = []
-        total_followers = 0
-        total_previous_followers = 0
-        platform_scores = []
-
+        # First pass: latest vs previous snapshot per platform
+        rows = []
         for platform_name, snapshots in platforms.items():
             if len(snapshots) < 2:
                 continue
 
-            # Sort by date (newest first)
-            snapshots = sorted(snapshots, key=lambda x: x[0], reverse=True)
+            # Sort by date (newest first); ISO dates sort lexically
+            snapshots = sorted(snapshots, key=_snapshot_date, reverse=True)
 
             latest_date, latest_followers, latest_engagement = snapshots[0]
             prev_date, prev_followers, prev_engagement = snapshots[1]
 
-            # Calculate growth
-            growth_absolute = latest_followers - prev_followers
-            growth_rate = (growth_absolute / prev_followers * 100) if prev_followers > 0 else 0
+            rows.append((platform_name, snapshots, latest_date, latest_followers, latest_engagement, prev_followers))
+
+        if not rows:
+            return []
+
+        platform_score_arr, growth_rates = _score_platforms(
+            np.array([row[3] for row in rows], dtype=np.float64),
+            np.array([row[5] for row in rows], dtype=np.float64),
+            np.array([row[4] for row in rows], dtype=np.float64),
+        )
+
+        # Second pass: build per-platform signals from the scored rows,
+        # then the aggregate
+        md = self.metadata
+        sig_type = md.signal_type
+        category = md.category
+        cid = company.id
+        # One slot per scored platform plus one for the aggregate, filled by
+        # index; the aggregate slot is trimmed if no aggregate is emitted
+        signals: List[Optional[Signal]] = [None] * (len(rows) + 1)
+        total_followers = 0
+        total_previous_followers = 0
+        score_sum = 0
+        platform_scores = []
+
+        for idx, (row, platform_score, growth_rate) in enumerate(
+            zip(rows, platform_score_arr.tolist(), growth_rates.tolist())
+        ):
+            platform_name, snapshots, latest_date, latest_followers, latest_engagement, prev_followers = row
 
             total_followers += latest_followers
             total_previous_followers += prev_followers
-
-            # Calculate score
-            # Growth component
-            if growth_rate > 5:
-                growth_score = min(60, 40 + growth_rate * 4)
-            elif growth_rate > 0:
-                growth_score = growth_rate * 8
-            elif growth_rate > -2:
-                growth_score = growth_rate * 10
-            else:
-                growth_score = max(-60, -40 + growth_rate * 5)
-
-            # Engagement component
-            # Good engagement: >3% for most platforms
-            # Average: 1-3%
-            # Poor: <1%
-            engagement_score = 0
-            if latest_engagement > 3:
-                engagement_score = 20
-            elif latest_engagement > 1.5:
-                engagement_score = 10
-            elif latest_engagement < 0.5:
-                engagement_score = -15
-
-            platform_score = int(growth_score + engagement_score)
-            platform_score = max(-100, min(100, platform_score))
+            score_sum += platform_score
 
             platform_scores.append({
                 "platform": platform_name,
@@ -212,7 +283,9 @@ class SocialMediaFollowersProcessor(SignalProcessor):
             })
 
             # Per-platform signal
-            description = f"{platform_name.title()}: {latest_followers:,} followers ({growth_rate:+.1f}% MoM)"
+            platform_title, source_name, tags = _platform_labels(platform_name)
+
+            description = f"{platform_title}: {latest_followers:,} followers ({growth_rate:+.1f}% MoM)"
             description += f" | Engagement: {latest_engagement}%"
 
             if growth_rate > 5:
@@ -221,10 +294,10 @@ class SocialMediaFollowersProcessor(SignalProcessor):
                 description += " 📉 Losing followers"
 
             signal = Signal(
-                company_id=company.id,
-                signal_type=f"{self.metadata.signal_type}_{platform_name}",
-                category=self.metadata.category,
-                timestamp=datetime.fromisoformat(latest_date),
+                company_id=cid,
+                signal_type=f"{sig_type}_{platform_name}",
+                category=category,
+                timestamp=_parse_date(latest_date),
                 raw_value={
                     "platform": platform_name,
                     "followers": latest_followers,
@@ -236,30 +309,28 @@ class SocialMediaFollowersProcessor(SignalProcessor):
                 confidence=0.75,
                 metadata=SignalMetadata(
                     source_url=f"https://www.{platform_name}.com/{company.name.lower().replace(' ', '')}",
-                    source_name=f"{platform_name.title()} Followers",
+                    source_name=source_name,
                     processing_notes=f"{growth_rate:+.1f}% MoM growth",
-                    raw_data_hash=hashlib.md5(
-                        json.dumps(snapshots, sort_keys=True, default=str).encode()
-                    ).hexdigest(),
+                    raw_data_hash=_hash_snapshots(tuple(map(tuple, snapshots))),
                 ),
                 description=description,
-                tags=["social_media", platform_name, "follower_growth"],
+                tags=tags,
             )
 
-            signals.append(signal)
+            signals[idx] = signal
 
         # Aggregate signal
         if total_previous_followers > 0:
             overall_growth = ((total_followers - total_previous_followers) / total_previous_followers) * 100
-            avg_score = sum(p["score"] for p in platform_scores) / len(platform_scores)
+            avg_score = score_sum / len(platform_scores)
 
             aggregate_description = f"Social media: {total_followers:,} total followers ({overall_growth:+.1f}% MoM)"
             aggregate_description += f" across {len(platforms)} platforms"
 
             aggregate_signal = Signal(
-                company_id=company.id,
-                signal_type=f"{self.metadata.signal_type}_aggregate",
-                category=self.metadata.category,
+                company_id=cid,
+                signal_type=f"{sig_type}_aggregate",
+                category=category,
                 timestamp=datetime.utcnow(),
                 raw_value={
                     "total_followers": total_followers,
@@ -273,14 +344,14 @@ class SocialMediaFollowersProcessor(SignalProcessor):
                     source_url="https://www.socialmedia.com",
                     source_name="Social Media (Aggregate)",
                     processing_notes=f"Aggregated from {len(platforms)} platforms",
-                    raw_data_hash=hashlib.md5(
-                        json.dumps(platform_scores, sort_keys=True, default=str).encode()
-                    ).hexdigest(),
+                    raw_data_hash=hash_payload(platform_scores),
                 ),
                 description=aggregate_description,
                 tags=["social_media", "aggregate", "brand_awareness"],
             )
 
-            signals.append(aggregate_signal)
+            signals[-1] = aggregate_signal
+        else:
+            del signals[-1]
 
-        return signals
+        return cast(List[Signal], signals)
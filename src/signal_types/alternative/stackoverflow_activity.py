@@ -40,10 +40,10 @@ Data Source: Stack Exchange API (free, 10,000 requests/day)
 Update Frequency: Weekly
 """
 
-from typing import List, Any, Dict, Optional
+from typing import List, Any, Dict, Set, Tuple
+from bisect import bisect_left
 from datetime import datetime, timedelta
-import hashlib
-import json
+import time
 
 import httpx
 from loguru import logger
@@ -57,11 +57,63 @@ from ...core.signal_processor import (
 )
 from ...core.signal import Signal, SignalCategory, SignalMetadata
 from ...core.company import Company
+from ...core.hashing import hash_items
+from ...core.http_retry import get_with_retry
+from ...core.loop_local import LoopLocal
+from ...core.rate_limiter import get_rate_limiter
+
+
+# Process-wide pacing for the Stack Exchange API (10,000 requests/day):
+# bursts of up to 30, then a steady 30 requests/minute
+_STACKEXCHANGE_LIMITER = get_rate_limiter("api.stackexchange.com", capacity=30, refill_per_sec=0.5)
+
+# Tag stats move slowly (the signal updates weekly), so re-runs within a few
+# hours reuse them: tag -> (fetched at, stats)
+_TAG_CACHE: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+_TAG_TTL = 6 * 3600.0
+
+# Sample data is constant, so it is built once and shared (treat as read-only)
+_SAMPLE_TAGS = {
+    "GOOGL": (
+        {"tag": "android", "count": 1450000, "followers": 385000},
+        {"tag": "google-cloud-platform", "count": 85000, "followers": 12000},
+        {"tag": "tensorflow", "count": 62000, "followers": 28000},
+        {"tag": "firebase", "count": 95000, "followers": 35000},
+    ),
+    "MSFT": (
+        {"tag": "azure", "count": 125000, "followers": 45000},
+        {"tag": ".net", "count": 680000, "followers": 195000},
+        {"tag": "typescript", "count": 185000, "followers": 62000},
+    ),
+}
+
+# /tags/{tags}/info accepts at most this many semicolon-separated tags
+_TAGS_PER_REQUEST = 100
 
 
 class StackOverflowActivityProcessor(SignalProcessor):
     """Track Stack Overflow question activity"""
 
+    # Piecewise-linear question-count score: band i covers counts up to
+    # _SCORE_THRESHOLDS[i] and scores base + (count - offset) / width * span
+    _SCORE_THRESHOLDS = (10_000, 100_000, 500_000, 1_000_000)
+    _SCORE_BANDS = (
+        (0, 0, 10_000, 20),
+        (20, 10_000, 90_000, 20),
+        (40, 100_000, 400_000, 20),
+        (60, 500_000, 500_000, 20),
+        (80, 1_000_000, 100_000, 1),
+    )
+
+    # One pooled HTTP/2 client per event loop, shared by all instances
+    _clients: LoopLocal[httpx.AsyncClient] = LoopLocal(
+        lambda: httpx.AsyncClient(
+            http2=True,
+            timeout=30.0,
+            headers={"Accept-Encoding": "gzip"},
+        )
+    )
+
     def __init__(self):
         """Initialize processor."""
         self.api_url = "https://api.stackexchange.com/2.3"
@@ -75,6 +127,22 @@ class StackOverflowActivityProcessor(SignalProcessor):
             "UBER": [],  # Uber doesn't have major developer products
         }
 
+    @classmethod
+    def _get_client(cls) -> httpx.AsyncClient:
+        """Return the running loop's shared HTTP client, creating it on first use"""
+        client = cls._clients.get()
+        if client.is_closed:
+            cls._clients.pop()
+            client = cls._clients.get()
+        return client
+
+    @classmethod
+    async def aclose(cls) -> None:
+        """Close the running loop's shared HTTP client"""
+        client = cls._clients.pop()
+        if client is not None:
+            await client.aclose()
+
     @property
     def metadata(self) -> SignalProcessorMetadata:
         return SignalProcessorMetadata(
@@ -111,37 +179,20 @@ class StackOverflowActivityProcessor(SignalProcessor):
         if not tags:
             return {}
 
-        # Fetch stats for each tag
-        tag_stats = []
-
+        # Serve warm tags from the cache; fetch the rest in one batched call
+        now = time.monotonic()
+        stats_by_tag = {}
         for tag in tags:
-            try:
-                # Get tag info
-                info_url = f"{self.api_url}/tags/{tag}/info"
-                params = {
-                    "site": "stackoverflow",
-                }
-
-                async with httpx.AsyncClient(timeout=30.0) as client:
-                    response = await client.get(info_url, params=params)
-                    response.raise_for_status()
-
-                    data = response.json()
-                    items = data.get("items", [])
-
-                    if items:
-                        tag_data = items[0]
-                        tag_stats.append({
-                            "tag": tag,
-                            "count": tag_data.get("count", 0),
-                            "followers": tag_data.get("followers_count", 0),
-                        })
+            cached = _TAG_CACHE.get(tag)
+            if cached is not None and now - cached[0] < _TAG_TTL:
+                stats_by_tag[tag] = cached[1]
 
-                        logger.info(f"Found {tag_data.get('count', 0)} questions for tag: {tag}")
+        missing = [tag for tag in tags if tag not in stats_by_tag]
+        if missing:
+            stats_by_tag.update(await self._fetch_tag_info(missing))
 
-            except Exception as e:
-                logger.warning(f"Error fetching Stack Overflow data for tag {tag}: {e}")
-                continue
+        # Keep tag order; drop tags that failed or returned nothing
+        tag_stats = [stats_by_tag[tag] for tag in tags if tag in stats_by_tag]
 
         if not tag_stats:
             logger.warning("No Stack Overflow data fetched - using sample data")
@@ -154,6 +205,108 @@ class StackOverflowActivityProcessor(SignalProcessor):
             "timestamp": datetime.utcnow(),
         }
 
+    async def _get_json(self, client: httpx.AsyncClient, path: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """GET one Stack Exchange endpoint through the shared limiter, honouring backoff"""
+        await _STACKEXCHANGE_LIMITER.acquire()
+        response = await get_with_retry(client, f"{self.api_url}{path}", params=params)
+
+        data = response.json()
+        backoff = data.get("backoff")
+        if backoff:
+            # Holds every caller of the shared limiter, not just this one
+            logger.warning(f"Stack Exchange requested a {backoff}s backoff")
+            _STACKEXCHANGE_LIMITER.backoff(backoff)
+        return data
+
+    async def _fetch_synonyms(
+        self,
+        client: httpx.AsyncClient,
+        canonical_tags: List[str],
+        wanted: Set[str]
+    ) -> Dict[str, List[str]]:
+        """
+        Map canonical tags back to the requested synonyms that resolve to them.
+
+        Returns:
+            canonical tag -> requested tags (from `wanted`) that are its synonyms
+        """
+        data = await self._get_json(
+            client,
+            f"/tags/{';'.join(canonical_tags)}/synonyms",
+            {"site": "stackoverflow", "pagesize": 100},
+        )
+
+        requested_by_canonical: Dict[str, List[str]] = {}
+        for synonym in data.get("items", []):
+            from_tag = synonym.get("from_tag")
+            if from_tag in wanted:
+                requested_by_canonical.setdefault(synonym.get("to_tag"), []).append(from_tag)
+        return requested_by_canonical
+
+    async def _fetch_tag_info(self, tags: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch stats for several tags with batched /tags/{a;b;...}/info calls.
+
+        The endpoint takes up to 100 semicolon-separated tags and costs one
+        quota unit per call, so a company's tags normally need one request.
+        A requested synonym comes back under its canonical name; those are
+        resolved with one /tags/{...}/synonyms call and filed under the tag
+        that was asked for.
+
+        Returns:
+            requested tag -> stats for the tags the API returned
+        """
+        client = self._get_client()
+        stats_by_tag = {}
+        for i in range(0, len(tags), _TAGS_PER_REQUEST):
+            batch = tags[i:i + _TAGS_PER_REQUEST]
+            try:
+                data = await self._get_json(
+                    client,
+                    f"/tags/{';'.join(batch)}/info",
+                    {"site": "stackoverflow", "pagesize": len(batch)},
+                )
+                items = data.get("items", [])
+
+                requested = set(batch)
+                unmatched = requested.difference(item.get("name") for item in items)
+                requested_by_canonical: Dict[str, List[str]] = {}
+                if unmatched and items:
+                    try:
+                        requested_by_canonical = await self._fetch_synonyms(
+                            client, [item.get("name") for item in items], unmatched
+                        )
+                    except (httpx.HTTPError, ValueError) as e:
+                        logger.warning(f"Error resolving Stack Overflow tag synonyms: {e}")
+
+                fetched_at = time.monotonic()
+                for tag_data in items:
+                    name = tag_data.get("name")
+                    requested_tags = requested_by_canonical.get(name, [])
+                    if name in requested:
+                        requested_tags = [name, *requested_tags]
+
+                    for tag in requested_tags:
+                        logger.info(f"Found {tag_data.get('count', 0)} questions for tag: {tag}")
+
+                        stats = {
+                            "tag": tag,
+                            "count": tag_data.get("count", 0),
+                            "followers": tag_data.get("followers_count", 0),
+                        }
+                        _TAG_CACHE[tag] = (fetched_at, stats)
+                        stats_by_tag[tag] = stats
+
+            except Exception as e:
+                logger.warning(f"Error fetching Stack Overflow data for tags {', '.join(batch)}: {e}")
+
+        return stats_by_tag
+
+    @staticmethod
+    def clear_cache() -> None:
+        """Drop cached tag stats so the next fetch goes to the API"""
+        _TAG_CACHE.clear()
+
     def process(self, company: Company, raw_data: Dict[str, Any]) -> List[Signal]:
         """
         Process Stack Overflow activity into signals.
@@ -168,14 +321,20 @@ class StackOverflowActivityProcessor(SignalProcessor):
         if not tags:
             return []
 
-        # Calculate aggregate metrics
-        total_questions = sum(tag.get("count", 0) for tag in tags)
-        total_followers = sum(tag.get("followers", 0) for tag in tags)
+        # Aggregate metrics and most popular tag in one pass
+        total_questions = 0
+        total_followers = 0
+        top_tag = tags[0]
+        top_count = -1
+        for tag in tags:
+            count = tag.get("count", 0)
+            total_questions += count
+            total_followers += tag.get("followers", 0)
+            if count > top_count:
+                top_count = count
+                top_tag = tag
         tag_count = len(tags)
 
-        # Find most popular tag
-        top_tag = max(tags, key=lambda t: t.get("count", 0))
-
         # Calculate score
         # More questions = more developer adoption
         # 1M+ questions = +80 to +100 (very popular)
@@ -184,16 +343,9 @@ class StackOverflowActivityProcessor(SignalProcessor):
         # 10k-100k = +20 to +40
         # <10k = 0 to +20
 
-        if total_questions > 1000000:
-            score = min(100, 80 + (total_questions - 1000000) / 100000)
-        elif total_questions > 500000:
-            score = 60 + ((total_questions - 500000) / 500000) * 20
-        elif total_questions > 100000:
-            score = 40 + ((total_questions - 100000) / 400000) * 20
-        elif total_questions > 10000:
-            score = 20 + ((total_questions - 10000) / 90000) * 20
-        else:
-            score = (total_questions / 10000) * 20
+        # Bands are upper-inclusive (the old ladder tested `>`), hence bisect_left
+        base, offset, width, span = self._SCORE_BANDS[bisect_left(self._SCORE_THRESHOLDS, total_questions)]
+        score = base + ((total_questions - offset) / width) * span
 
         score = int(max(0, min(100, score)))
 
@@ -223,9 +375,7 @@ class StackOverflowActivityProcessor(SignalProcessor):
                 source_url="https://stackoverflow.com",
                 source_name="Stack Overflow",
                 processing_notes=f"{total_questions:,} questions, {tag_count} tags tracked",
-                raw_data_hash=hashlib.md5(
-                    json.dumps(tags, sort_keys=True, default=str).encode()
-                ).hexdigest(),
+                raw_data_hash=hash_items(tags),
             ),
             description=description,
             tags=["stackoverflow", "developer", "adoption"],
@@ -235,21 +385,7 @@ class StackOverflowActivityProcessor(SignalProcessor):
 
     def _get_sample_data(self, company: Company) -> Dict[str, Any]:
         """Return sample Stack Overflow data"""
-        if company.ticker == "GOOGL":
-            sample_tags = [
-                {"tag": "android", "count": 1450000, "followers": 385000},
-                {"tag": "google-cloud-platform", "count": 85000, "followers": 12000},
-                {"tag": "tensorflow", "count": 62000, "followers": 28000},
-                {"tag": "firebase", "count": 95000, "followers": 35000},
-            ]
-        elif company.ticker == "MSFT":
-            sample_tags = [
-                {"tag": "azure", "count": 125000, "followers": 45000},
-                {"tag": ".net", "count": 680000, "followers": 195000},
-                {"tag": "typescript", "count": 185000, "followers": 62000},
-            ]
-        else:
-            sample_tags = []
+        sample_tags = _SAMPLE_TAGS.get(company.ticker, ())
 
         return {
             "company_id": company.id,
@@ -20,13 +20,17 @@ Data Source: SEC EDGAR (Exhibit 21 from 10-K filings) - free
 Update Frequency: Annual (filed with 10-K)
 """
 
-from typing import List, Any, Dict, Optional, Tuple
+from typing import List, Any, Dict, Tuple
 from datetime import datetime
-import hashlib
-import json
+from collections import OrderedDict
+from functools import lru_cache
+from html import unescape
+import asyncio
 import re
+import time
 
 import httpx
+import orjson
 from loguru import logger
 
 from ...core.signal_processor import (
@@ -38,6 +42,131 @@ from ...core.signal_processor import (
 )
 from ...core.signal import Signal, SignalCategory, SignalMetadata
 from ...core.company import Company
+from ...core.hashing import hash_items
+from ...core.http_retry import get_with_retry
+from ...core.loop_local import LoopLocal
+
+
+# Filings change at most a few times a year; re-runs within a few hours
+# reuse them: CIK -> (fetched at, latest 10-K filings and their subsidiaries)
+_SUBMISSIONS_CACHE: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+_SUBMISSIONS_MAXSIZE = 256
+_SUBMISSIONS_TTL = 6 * 3600.0
+
+# SEC fair access allows 10 requests/second; stay well under it
+# (per event loop - a semaphore binds to the loop that first waits on it)
+_SEC_SEMAPHORES: LoopLocal[asyncio.Semaphore] = LoopLocal(lambda: asyncio.Semaphore(5))
+
+# Exhibit 21 document names look like "ex21.htm", "ex-21_1.htm", "...xex21.htm"
+_EX21_NAME_RE = re.compile(r"ex-?21", re.IGNORECASE)
+_ROW_RE = re.compile(r"<tr\b.*?</tr>", re.IGNORECASE | re.DOTALL)
+_CELL_RE = re.compile(r"<t[dh]\b[^>]*>(.*?)</t[dh]>", re.IGNORECASE | re.DOTALL)
+_TAG_RE = re.compile(r"<[^>]+>")
+
+# Column-heading vocabulary. A row is a header when every cell is made of
+# these words ("Name of Subsidiary", "State or Other Jurisdiction of
+# Incorporation", "% Owned", ...); subsidiary names never are.
+_HEADER_CELL_RE = re.compile(
+    r"^(?:[\s%()/,.&-]|\b(?:name|names|of|the|entity|subsidiary|subsidiaries|company|"
+    r"companies|legal|state|states|other|or|and|country|countries|jurisdiction|"
+    r"jurisdictions|incorporation|incorporated|organization|organized|formation|"
+    r"domicile|place|percent|percentage|ownership|owned|interest|held|by|registrant)\b)+$",
+    re.IGNORECASE,
+)
+# Header cells naming the jurisdiction column
+_JURISDICTION_HEADER_RE = re.compile(
+    r"jurisdiction|state|country|incorporat|organi[sz]|domicile|place", re.IGNORECASE
+)
+
+# Legal-form suffix at the end of a name ("Foo, Inc.", "Foo LLC", "Foo B.V.")
+_SUFFIX_RE = re.compile(r"(?:,\s*|\s+)(?:inc\.?|llc|ltd\.?|b\.v\.|s\.a\.)\s*$", re.IGNORECASE)
+
+
+# Sample data is constant, so it is built once and shared (treat as read-only)
+_UBER_SAMPLE_CURRENT_SUBSIDIARIES = (
+    {"name": "Uber Technologies, Inc.", "jurisdiction": "Delaware, United States"},
+    {"name": "Uber International B.V.", "jurisdiction": "Netherlands"},
+    {"name": "Uber Portier B.V.", "jurisdiction": "Netherlands"},
+    {"name": "Uber London Limited", "jurisdiction": "United Kingdom"},
+    {"name": "Uber India Systems Private Limited", "jurisdiction": "India"},
+    {"name": "Uber Japan Co., Ltd.", "jurisdiction": "Japan"},
+    {"name": "Uber Australia Pty Ltd", "jurisdiction": "Australia"},
+    {"name": "Uber Brazil Technology Ltda.", "jurisdiction": "Brazil"},
+    {"name": "Uber Canada, Inc.", "jurisdiction": "Canada"},
+    {"name": "Uber Freight LLC", "jurisdiction": "Delaware, United States"},
+    {"name": "Uber Eats, Inc.", "jurisdiction": "Delaware, United States"},
+    {"name": "Uber Insurance Management, Inc.", "jurisdiction": "Delaware, United States"},
+    {"name": "Uber Health, Inc.", "jurisdiction": "California, United States"},
+    # New additions (expansion signals)
+    {"name": "Uber Vietnam Technology Co., Ltd.", "jurisdiction": "Vietnam"},
+    {"name": "Uber Financial Services LLC", "jurisdiction": "Delaware, United States"},
+    {"name": "Uber Autonomous Technologies, Inc.", "jurisdiction": "California, United States"},
+    {"name": "Uber Philippines, Inc.", "jurisdiction": "Philippines"},
+)
+
+_UBER_SAMPLE_PRIOR_SUBSIDIARIES = (
+    {"name": "Uber Technologies, Inc.", "jurisdiction": "Delaware, United States"},
+    {"name": "Uber International B.V.", "jurisdiction": "Netherlands"},
+    {"name": "Uber Portier B.V.", "jurisdiction": "Netherlands"},
+    {"name": "Uber London Limited", "jurisdiction": "United Kingdom"},
+    {"name": "Uber India Systems Private Limited", "jurisdiction": "India"},
+    {"name": "Uber Japan Co., Ltd.", "jurisdiction": "Japan"},
+    {"name": "Uber Australia Pty Ltd", "jurisdiction": "Australia"},
+    {"name": "Uber Brazil Technology Ltda.", "jurisdiction": "Brazil"},
+    {"name": "Uber Canada, Inc.", "jurisdiction": "Canada"},
+    {"name": "Uber Freight LLC", "jurisdiction": "Delaware, United States"},
+    {"name": "Uber Eats, Inc.", "jurisdiction": "Delaware, United States"},
+    {"name": "Uber Insurance Management, Inc.", "jurisdiction": "Delaware, United States"},
+    {"name": "Uber Health, Inc.", "jurisdiction": "California, United States"},
+    # Removed (contraction signal)
+    {"name": "Uber China Technology Co., Ltd.", "jurisdiction": "China"},
+)
+
+
+def _parse_exhibit21(html: str) -> List[Dict[str, str]]:
+    """
+    Pull (name, jurisdiction) rows out of an Exhibit 21 HTML table.
+
+    Exhibit 21 is conventionally a table with the subsidiary name first and
+    the jurisdiction of organization in a later column. Header rows are
+    skipped, and a header naming the jurisdiction column picks it (so an
+    ownership-percentage column is not mistaken for it); otherwise the last
+    column is used. Spacer cells are ignored. Exhibits laid out as plain
+    paragraphs yield no rows.
+    """
+    subsidiaries = []
+    jurisdiction_col = -1
+    for row in _ROW_RE.findall(html):
+        cells = [" ".join(unescape(_TAG_RE.sub(" ", cell)).split()) for cell in _CELL_RE.findall(row)]
+        cells = [cell for cell in cells if cell]
+        if not cells:
+            continue
+        if all(_HEADER_CELL_RE.match(cell) for cell in cells):
+            jurisdiction_col = next(
+                (i for i, cell in enumerate(cells) if i and _JURISDICTION_HEADER_RE.search(cell)),
+                -1,
+            )
+            continue
+        if len(cells) < 2:
+            continue
+        jurisdiction = cells[jurisdiction_col] if jurisdiction_col < len(cells) else cells[-1]
+        subsidiaries.append({"name": cells[0], "jurisdiction": jurisdiction})
+    return subsidiaries
+
+
+def _compile_keywords(groups: Dict[str, Tuple[str, ...]]) -> Tuple["re.Pattern[str]", Dict[str, str]]:
+    """
+    Compile a {label: (keywords)} map into one scanning regex.
+
+    The alternation sits inside a lookahead so matches may overlap, giving
+    the same plain-substring semantics as `kw in text` for every keyword.
+
+    Returns:
+        (pattern whose group 1 is the matched keyword, keyword -> label)
+    """
+    labels = {kw: label for label, keywords in groups.items() for kw in keywords}
+    alternation = "|".join(map(re.escape, sorted(labels, key=len, reverse=True)))
+    return re.compile(f"(?=({alternation}))"), labels
 
 
 class SubsidiaryRegistrationsProcessor(SignalProcessor):
@@ -45,35 +174,54 @@ class SubsidiaryRegistrationsProcessor(SignalProcessor):
 
     # Country/jurisdiction keywords for geographic analysis
     GEOGRAPHIC_REGIONS = {
-        "americas": [
+        "americas": (
             "united states", "delaware", "california", "new york", "texas",
             "canada", "brazil", "mexico", "argentina", "colombia",
-        ],
-        "europe": [
+        ),
+        "europe": (
             "united kingdom", "netherlands", "ireland", "germany", "france",
             "spain", "italy", "luxembourg", "switzerland", "sweden",
-        ],
-        "asia_pacific": [
+        ),
+        "asia_pacific": (
             "india", "japan", "china", "hong kong", "singapore", "australia",
             "south korea", "taiwan", "indonesia", "vietnam", "philippines",
-        ],
-        "middle_east_africa": [
+        ),
+        "middle_east_africa": (
             "united arab emirates", "saudi arabia", "south africa", "nigeria",
             "egypt", "kenya", "israel", "qatar",
-        ],
+        ),
     }
 
     # Entity type keywords for business line analysis
     ENTITY_TYPES = {
-        "insurance": ["insurance", "indemnity", "underwriting"],
-        "financing": ["finance", "financial", "capital", "lending", "credit"],
-        "technology": ["technology", "tech", "software", "digital", "data"],
-        "logistics": ["logistics", "freight", "shipping", "delivery", "courier"],
-        "food_delivery": ["eats", "food", "restaurant", "dining"],
-        "mobility": ["mobility", "ride", "transport", "vehicle", "auto"],
-        "holding": ["holdings", "holding", "group", "parent"],
+        "insurance": ("insurance", "indemnity", "underwriting"),
+        "financing": ("finance", "financial", "capital", "lending", "credit"),
+        "technology": ("technology", "tech", "software", "digital", "data"),
+        "logistics": ("logistics", "freight", "shipping", "delivery", "courier"),
+        "food_delivery": ("eats", "food", "restaurant", "dining"),
+        "mobility": ("mobility", "ride", "transport", "vehicle", "auto"),
+        "holding": ("holdings", "holding", "group", "parent"),
     }
 
+    # Forms whose filings carry Exhibit 21
+    _TEN_K_FORMS = frozenset({"10-K", "10-K/A"})
+
+    # Every keyword scanned in one pass; regions keep their declared priority
+    _GEO_RE, _GEO_LABELS = _compile_keywords(GEOGRAPHIC_REGIONS)
+    _REGION_RANK = {region: rank for rank, region in enumerate(GEOGRAPHIC_REGIONS)}
+    _ENTITY_RE, _ENTITY_LABELS = _compile_keywords(ENTITY_TYPES)
+
+    # Shared across instances (one per event loop) so the data.sec.gov
+    # connection and its HTTP/2 session survive from one fetch to the next
+    _clients: LoopLocal[httpx.AsyncClient] = LoopLocal(
+        lambda: httpx.AsyncClient(
+            http2=True,
+            timeout=30.0,
+            limits=httpx.Limits(max_keepalive_connections=16),
+            headers={"User-Agent": "CousinEddie/1.0 research@example.com"},
+        )
+    )
+
     def __init__(self):
         """Initialize processor."""
         self.edgar_base_url = "https://efts.sec.gov/LATEST/search-index"
@@ -85,6 +233,22 @@ class SubsidiaryRegistrationsProcessor(SignalProcessor):
             "UBER": "0001543151",
         }
 
+    @classmethod
+    def _get_client(cls) -> httpx.AsyncClient:
+        """Return the running loop's shared HTTP client, creating it on first use"""
+        client = cls._clients.get()
+        if client.is_closed:
+            cls._clients.pop()
+            client = cls._clients.get()
+        return client
+
+    @classmethod
+    async def aclose(cls) -> None:
+        """Close the running loop's shared HTTP client"""
+        client = cls._clients.pop()
+        if client is not None:
+            await client.aclose()
+
     @property
     def metadata(self) -> SignalProcessorMetadata:
         return SignalProcessorMetadata(
@@ -119,49 +283,78 @@ class SubsidiaryRegistrationsProcessor(SignalProcessor):
 
         cik = self.cik_mappings[company.id]
 
+        cached = _SUBMISSIONS_CACHE.get(cik)
+        if cached is not None and time.monotonic() - cached[0] < _SUBMISSIONS_TTL:
+            return {
+                "company_id": company.id,
+                "ticker": company.ticker,
+                **cached[1],
+                "timestamp": datetime.utcnow(),
+            }
+
         try:
-            async with httpx.AsyncClient(
-                timeout=30.0,
-                headers={"User-Agent": "CousinEddie/1.0 research@example.com"},
-            ) as client:
-                logger.info(f"Fetching Exhibit 21 data for {company.ticker} from SEC EDGAR")
-
-                # Fetch company filings index from EDGAR
-                submissions_url = f"https://data.sec.gov/submissions/CIK{cik}.json"
-                response = await client.get(submissions_url)
-                response.raise_for_status()
-
-                submissions = response.json()
-                recent_filings = submissions.get("filings", {}).get("recent", {})
-
-                # Find 10-K filings (which contain Exhibit 21)
-                forms = recent_filings.get("form", [])
-                accession_numbers = recent_filings.get("accessionNumber", [])
-                filing_dates = recent_filings.get("filingDate", [])
-
-                ten_k_filings = []
-                for i, form in enumerate(forms):
-                    if form in ("10-K", "10-K/A"):
-                        ten_k_filings.append({
-                            "accession_number": accession_numbers[i],
-                            "filing_date": filing_dates[i],
-                            "form": form,
-                        })
-
-                if len(ten_k_filings) < 1:
-                    logger.warning(f"No 10-K filings found for {company.ticker}")
-                    return self._get_sample_data(company, start, end)
-
-                logger.info(
-                    f"Found {len(ten_k_filings)} 10-K filings for {company.ticker}"
-                )
-
-                return {
-                    "company_id": company.id,
-                    "ticker": company.ticker,
-                    "ten_k_filings": ten_k_filings[:2],
-                    "timestamp": datetime.utcnow(),
-                }
+            client = self._get_client()
+            logger.info(f"Fetching Exhibit 21 data for {company.ticker} from SEC EDGAR")
+
+            # Fetch company filings index from EDGAR
+            submissions_url = f"https://data.sec.gov/submissions/CIK{cik}.json"
+            async with _SEC_SEMAPHORES.get():
+                response = await get_with_retry(client, submissions_url)
+
+            # Submissions JSON runs to megabytes for big filers; orjson parses
+            # it straight from the body bytes, and only the filings.recent
+            # arrays are kept past this point
+            recent_filings = orjson.loads(response.content).get("filings", {}).get("recent", {})
+
+            # Find 10-K filings (which contain Exhibit 21)
+            forms = recent_filings.get("form", [])
+            accession_numbers = recent_filings.get("accessionNumber", [])
+            filing_dates = recent_filings.get("filingDate", [])
+
+            ten_k_filings = []
+            for i, form in enumerate(forms):
+                if form in self._TEN_K_FORMS:
+                    ten_k_filings.append({
+                        "accession_number": accession_numbers[i],
+                        "filing_date": filing_dates[i],
+                        "form": form,
+                    })
+                    # Filings are newest first; only the latest two are compared
+                    if len(ten_k_filings) == 2:
+                        break
+
+            if len(ten_k_filings) < 1:
+                logger.warning(f"No 10-K filings found for {company.ticker}")
+                return self._get_sample_data(company, start, end)
+
+            logger.info(
+                f"Found {len(ten_k_filings)} 10-K filings for {company.ticker}"
+            )
+
+            # Current and prior year exhibits download concurrently
+            exhibits = await asyncio.gather(
+                *(self._fetch_exhibit21(client, cik, filing) for filing in ten_k_filings)
+            )
+
+            # A diff needs both years: with only one list every subsidiary
+            # would look newly added, so a missing or unparseable exhibit
+            # leaves both out
+            filings_data: Dict[str, Any] = {"ten_k_filings": ten_k_filings}
+            if len(exhibits) == 2 and exhibits[0] and exhibits[1]:
+                filings_data["current_subsidiaries"] = exhibits[0]
+                filings_data["prior_subsidiaries"] = exhibits[1]
+
+            _SUBMISSIONS_CACHE[cik] = (time.monotonic(), filings_data)
+            _SUBMISSIONS_CACHE.move_to_end(cik)
+            if len(_SUBMISSIONS_CACHE) > _SUBMISSIONS_MAXSIZE:
+                _SUBMISSIONS_CACHE.popitem(last=False)
+
+            return {
+                "company_id": company.id,
+                "ticker": company.ticker,
+                **filings_data,
+                "timestamp": datetime.utcnow(),
+            }
 
         except httpx.HTTPError as e:
             logger.error(f"Error fetching EDGAR data: {e}")
@@ -171,6 +364,37 @@ class SubsidiaryRegistrationsProcessor(SignalProcessor):
             logger.error(f"Unexpected error fetching subsidiary data: {e}")
             return self._get_sample_data(company, start, end)
 
+    async def _fetch_exhibit21(
+        self,
+        client: httpx.AsyncClient,
+        cik: str,
+        filing: Dict[str, Any]
+    ) -> List[Dict[str, str]]:
+        """Download and parse one 10-K's Exhibit 21; [] if missing or unreadable"""
+        accession = filing["accession_number"].replace("-", "")
+        filing_url = f"https://www.sec.gov/Archives/edgar/data/{int(cik)}/{accession}"
+
+        try:
+            async with _SEC_SEMAPHORES.get():
+                index = await get_with_retry(client, f"{filing_url}/index.json")
+            documents = orjson.loads(index.content).get("directory", {}).get("item", [])
+
+            exhibit_name = next(
+                (doc["name"] for doc in documents if _EX21_NAME_RE.search(doc.get("name", ""))),
+                None,
+            )
+            if exhibit_name is None:
+                logger.warning(f"No Exhibit 21 in filing {filing['accession_number']}")
+                return []
+
+            async with _SEC_SEMAPHORES.get():
+                response = await get_with_retry(client, f"{filing_url}/{exhibit_name}")
+            return _parse_exhibit21(response.text)
+
+        except (httpx.HTTPError, ValueError) as e:
+            logger.warning(f"Error fetching Exhibit 21 for filing {filing['accession_number']}: {e}")
+            return []
+
     def process(self, company: Company, raw_data: Dict[str, Any]) -> List[Signal]:
         """
         Process subsidiary data into signals.
@@ -185,34 +409,45 @@ class SubsidiaryRegistrationsProcessor(SignalProcessor):
             return []
 
         signals = []
+        # One timestamp for the batch so both signals line up downstream
+        now = datetime.utcnow()
+
+        geo_re, geo_labels, region_rank = self._GEO_RE, self._GEO_LABELS, self._REGION_RANK
+        entity_re, entity_labels = self._ENTITY_RE, self._ENTITY_LABELS
 
         # Normalize subsidiary names for comparison
-        current_names = {self._normalize_name(s.get("name", "")) for s in current_subs}
         prior_names = {self._normalize_name(s.get("name", "")) for s in prior_subs}
 
-        added = current_names - prior_names
-        removed = prior_names - current_names
-        net_change = len(added) - len(removed)
-
-        # Analyze geographic distribution of new subsidiaries
-        new_regions = set()
+        # Normalize each current subsidiary once, keyed by normalized name
+        current_norm = {}
         for sub in current_subs:
-            name_lower = self._normalize_name(sub.get("name", ""))
-            if name_lower in added:
-                jurisdiction = sub.get("jurisdiction", "").lower()
-                for region, keywords in self.GEOGRAPHIC_REGIONS.items():
-                    if any(kw in jurisdiction for kw in keywords):
-                        new_regions.add(region)
-                        break
+            current_norm.setdefault(self._normalize_name(sub.get("name", "")), sub)
+
+        added = current_norm.keys() - prior_names
+        removed = prior_names - current_norm.keys()
 
-        # Analyze entity types of new subsidiaries
+        # Classify only the new subsidiaries by geography and business line
+        new_regions = set()
         new_business_lines = set()
-        for sub in current_subs:
-            name_lower = self._normalize_name(sub.get("name", ""))
-            if name_lower in added:
-                for biz_type, keywords in self.ENTITY_TYPES.items():
-                    if any(kw in name_lower for kw in keywords):
-                        new_business_lines.add(biz_type)
+        for name_lower in added:
+            sub = current_norm[name_lower]
+
+            # Exhibit 21 jurisdictions are mostly a bare country or
+            # "State, Country", so try an exact lookup on the last part
+            # before scanning the whole string
+            jurisdiction = sub.get("jurisdiction", "").strip().lower()
+            region = geo_labels.get(jurisdiction.rpartition(", ")[2])
+            if region is not None:
+                new_regions.add(region)
+            else:
+                matched = {geo_labels[kw] for kw in geo_re.findall(jurisdiction)}
+                if matched:
+                    # First region in declaration order wins
+                    new_regions.add(min(matched, key=region_rank.__getitem__))
+
+            new_business_lines.update(entity_labels[kw] for kw in entity_re.findall(name_lower))
+
+        net_change = len(added) - len(removed)
 
         # Signal 1: Net subsidiary changes (expansion vs contraction)
         if added or removed:
@@ -252,7 +487,7 @@ class SubsidiaryRegistrationsProcessor(SignalProcessor):
                 company_id=company.id,
                 signal_type=self.metadata.signal_type,
                 category=self.metadata.category,
-                timestamp=datetime.utcnow(),
+                timestamp=now,
                 raw_value={
                     "current_count": len(current_subs),
                     "prior_count": len(prior_subs),
@@ -274,11 +509,7 @@ class SubsidiaryRegistrationsProcessor(SignalProcessor):
                         f"Compared {len(current_subs)} current vs "
                         f"{len(prior_subs)} prior year subsidiaries"
                     ),
-                    raw_data_hash=hashlib.md5(
-                        json.dumps(
-                            sorted(list(current_names)), default=str
-                        ).encode()
-                    ).hexdigest(),
+                    raw_data_hash=hash_items(sorted(current_norm)),
                 ),
                 description=description,
                 tags=["subsidiaries", "corporate_structure", "expansion"],
@@ -292,7 +523,7 @@ class SubsidiaryRegistrationsProcessor(SignalProcessor):
                 company_id=company.id,
                 signal_type=self.metadata.signal_type,
                 category=self.metadata.category,
-                timestamp=datetime.utcnow(),
+                timestamp=now,
                 raw_value={
                     "event_type": "geographic_expansion",
                     "new_regions": sorted(new_regions),
@@ -312,65 +543,22 @@ class SubsidiaryRegistrationsProcessor(SignalProcessor):
 
         return signals
 
-    def _normalize_name(self, name: str) -> str:
-        """Normalize subsidiary name for comparison."""
-        name = name.lower().strip()
-        # Remove common suffixes
-        for suffix in [", inc.", ", llc", ", ltd", ", b.v.", ", s.a.", " inc", " llc", " ltd"]:
-            name = name.replace(suffix, "")
-        return name.strip()
+    @staticmethod
+    @lru_cache(maxsize=8192)
+    def _normalize_name(name: str) -> str:
+        """Normalize subsidiary name for comparison (most recur across years)."""
+        return _SUFFIX_RE.sub("", name.lower().strip()).strip()
 
     def _get_sample_data(
         self, company: Company, start: datetime, end: datetime
     ) -> Dict[str, Any]:
         """Return sample subsidiary data for when EDGAR is unavailable."""
-        if company.ticker == "UBER":
-            current_subsidiaries = [
-                {"name": "Uber Technologies, Inc.", "jurisdiction": "Delaware, United States"},
-                {"name": "Uber International B.V.", "jurisdiction": "Netherlands"},
-                {"name": "Uber Portier B.V.", "jurisdiction": "Netherlands"},
-                {"name": "Uber London Limited", "jurisdiction": "United Kingdom"},
-                {"name": "Uber India Systems Private Limited", "jurisdiction": "India"},
-                {"name": "Uber Japan Co., Ltd.", "jurisdiction": "Japan"},
-                {"name": "Uber Australia Pty Ltd", "jurisdiction": "Australia"},
-                {"name": "Uber Brazil Technology Ltda.", "jurisdiction": "Brazil"},
-                {"name": "Uber Canada, Inc.", "jurisdiction": "Canada"},
-                {"name": "Uber Freight LLC", "jurisdiction": "Delaware, United States"},
-                {"name": "Uber Eats, Inc.", "jurisdiction": "Delaware, United States"},
-                {"name": "Uber Insurance Management, Inc.", "jurisdiction": "Delaware, United States"},
-                {"name": "Uber Health, Inc.", "jurisdiction": "California, United States"},
-                # New additions (expansion signals)
-                {"name": "Uber Vietnam Technology Co., Ltd.", "jurisdiction": "Vietnam"},
-                {"name": "Uber Financial Services LLC", "jurisdiction": "Delaware, United States"},
-                {"name": "Uber Autonomous Technologies, Inc.", "jurisdiction": "California, United States"},
-                {"name": "Uber Philippines, Inc.", "jurisdiction": "Philippines"},
-            ]
-
-            prior_subsidiaries = [
-                {"name": "Uber Technologies, Inc.", "jurisdiction": "Delaware, United States"},
-                {"name": "Uber International B.V.", "jurisdiction": "Netherlands"},
-                {"name": "Uber Portier B.V.", "jurisdiction": "Netherlands"},
-                {"name": "Uber London Limited", "jurisdiction": "United Kingdom"},
-                {"name": "Uber India Systems Private Limited", "jurisdiction": "India"},
-                {"name": "Uber Japan Co., Ltd.", "jurisdiction": "Japan"},
-                {"name": "Uber Australia Pty Ltd", "jurisdiction": "Australia"},
-                {"name": "Uber Brazil Technology Ltda.", "jurisdiction": "Brazil"},
-                {"name": "Uber Canada, Inc.", "jurisdiction": "Canada"},
-                {"name": "Uber Freight LLC", "jurisdiction": "Delaware, United States"},
-                {"name": "Uber Eats, Inc.", "jurisdiction": "Delaware, United States"},
-                {"name": "Uber Insurance Management, Inc.", "jurisdiction": "Delaware, United States"},
-                {"name": "Uber Health, Inc.", "jurisdiction": "California, United States"},
-                # Removed (contraction signal)
-                {"name": "Uber China Technology Co., Ltd.", "jurisdiction": "China"},
-            ]
-        else:
-            current_subsidiaries = []
-            prior_subsidiaries = []
+        is_uber = company.ticker == "UBER"
 
         return {
             "company_id": company.id,
             "ticker": company.ticker,
-            "current_subsidiaries": current_subsidiaries,
-            "prior_subsidiaries": prior_subsidiaries,
+            "current_subsidiaries": _UBER_SAMPLE_CURRENT_SUBSIDIARIES if is_uber else [],
+            "prior_subsidiaries": _UBER_SAMPLE_PRIOR_SUBSIDIARIES if is_uber else [],
             "timestamp": datetime.utcnow(),
         }
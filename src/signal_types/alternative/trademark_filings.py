@@ -18,8 +18,10 @@ API: https://tsdrapi.uspto.gov
 Update Frequency: Weekly (new filings published weekly)
 """
 
-from typing import List, Any, Dict
+from typing import List, Any, Dict, Optional
 from datetime import datetime
+from itertools import chain
+import asyncio
 import hashlib
 import json
 
@@ -35,6 +37,57 @@ from ...core.signal_processor import (
 )
 from ...core.signal import Signal, SignalCategory, SignalMetadata
 from ...core.company import Company
+from ...core.loop_local import LoopLocal
+
+
+# Sample data is constant, so it is built once and shared (treat as read-only)
+_UBER_SAMPLE_TRADEMARKS = (
+    {
+        "serial_number": "98765432",
+        "mark_text": "UBER SHUTTLE",
+        "status": "new application",
+        "filing_date": "2026-01-15",
+        "nice_classes": [39, 42],
+        "owner": "Uber Technologies, Inc.",
+        "description": "Transportation scheduling and routing services",
+    },
+    {
+        "serial_number": "98765433",
+        "mark_text": "UBER TEENS",
+        "status": "pending",
+        "filing_date": "2025-11-20",
+        "nice_classes": [39, 9],
+        "owner": "Uber Technologies, Inc.",
+        "description": "Ride-sharing services for minors with parental controls",
+    },
+    {
+        "serial_number": "98765434",
+        "mark_text": "UBER PAY",
+        "status": "published",
+        "filing_date": "2025-10-05",
+        "nice_classes": [36, 42],
+        "owner": "Uber Technologies, Inc.",
+        "description": "Electronic payment processing services",
+    },
+    {
+        "serial_number": "87654321",
+        "mark_text": "UBER RUSH",
+        "status": "abandoned",
+        "filing_date": "2019-03-15",
+        "nice_classes": [39],
+        "owner": "Uber Technologies, Inc.",
+        "description": "Same-day delivery services",
+    },
+    {
+        "serial_number": "87654322",
+        "mark_text": "UBER COPTER",
+        "status": "registered",
+        "filing_date": "2019-06-01",
+        "nice_classes": [39],
+        "owner": "Uber Technologies, Inc.",
+        "description": "Helicopter transportation services",
+    },
+)
 
 
 class TrademarkFilingsProcessor(SignalProcessor):
@@ -55,7 +108,33 @@ class TrademarkFilingsProcessor(SignalProcessor):
     }
 
     # Growth-oriented Nice classes (signal expansion into new markets)
-    GROWTH_CLASSES = {36, 38, 39, 42, 43, 44}
+    GROWTH_CLASSES = frozenset({36, 38, 39, 42, 43, 44})
+
+    # TSDR status (lowercased) -> bucket, one dict lookup per trademark
+    _STATUS_BUCKETS = {
+        "new application": "new_applications",
+        "pending": "new_applications",
+        "published": "new_applications",
+        "registered": "registered",
+        "live": "registered",
+        "abandoned": "abandoned",
+        "dead": "abandoned",
+        "cancelled": "abandoned",
+        "opposition": "opposed",
+        "opposed": "opposed",
+    }
+    _STATUS_BUCKET_NAMES = ("new_applications", "registered", "abandoned", "opposed")
+
+    # Shared across instances (one per event loop) so the tsdrapi.uspto.gov
+    # connection stays warm between scheduled fetches
+    _clients: LoopLocal[httpx.AsyncClient] = LoopLocal(
+        lambda: httpx.AsyncClient(
+            http2=True,
+            timeout=30.0,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+            headers={"Accept": "application/json"},
+        )
+    )
 
     def __init__(self):
         """Initialize processor."""
@@ -72,6 +151,22 @@ class TrademarkFilingsProcessor(SignalProcessor):
             "UBER ONE", "UBER FOR BUSINESS", "UBER HEALTH",
         ]
 
+    @classmethod
+    def _get_client(cls) -> httpx.AsyncClient:
+        """Return the running loop's shared HTTP client, creating it on first use"""
+        client = cls._clients.get()
+        if client.is_closed:
+            cls._clients.pop()
+            client = cls._clients.get()
+        return client
+
+    @classmethod
+    async def aclose(cls) -> None:
+        """Close the running loop's shared HTTP client"""
+        client = cls._clients.pop()
+        if client is not None:
+            await client.aclose()
+
     @property
     def metadata(self) -> SignalProcessorMetadata:
         return SignalProcessorMetadata(
@@ -106,38 +201,31 @@ class TrademarkFilingsProcessor(SignalProcessor):
         owner_names = self.owner_mappings[company.id]
 
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                logger.info(f"Fetching trademark data for {company.ticker} from USPTO TSDR")
-
-                all_trademarks = []
-
-                for owner_name in owner_names:
-                    # USPTO TSDR API - search by owner name
-                    params = {
-                        "ownerName": owner_name,
-                        "status": "all",
-                    }
-
-                    response = await client.get(
-                        self.tsdr_api_url,
-                        params=params,
-                        headers={"Accept": "application/json"},
-                    )
-                    response.raise_for_status()
-
-                    data = response.json()
-                    trademarks = data.get("trademarks", [])
-                    all_trademarks.extend(trademarks)
-
-                logger.info(f"Found {len(all_trademarks)} trademarks for {company.ticker}")
-
-                return {
-                    "company_id": company.id,
-                    "ticker": company.ticker,
-                    "trademarks": all_trademarks,
-                    "total_count": len(all_trademarks),
-                    "timestamp": datetime.utcnow(),
-                }
+            client = self._get_client()
+            logger.info(f"Fetching trademark data for {company.ticker} from USPTO TSDR")
+
+            # Query every owner name concurrently
+            results = await asyncio.gather(
+                *(self._fetch_owner(client, owner_name) for owner_name in owner_names)
+            )
+
+            if all(trademarks is None for trademarks in results):
+                logger.warning("Using sample trademark data")
+                return self._get_sample_data(company, start, end)
+
+            all_trademarks = list(chain.from_iterable(
+                trademarks for trademarks in results if trademarks is not None
+            ))
+
+            logger.info(f"Found {len(all_trademarks)} trademarks for {company.ticker}")
+
+            return {
+                "company_id": company.id,
+                "ticker": company.ticker,
+                "trademarks": all_trademarks,
+                "total_count": len(all_trademarks),
+                "timestamp": datetime.utcnow(),
+            }
 
         except httpx.HTTPError as e:
             logger.error(f"Error fetching trademark data: {e}")
@@ -147,6 +235,28 @@ class TrademarkFilingsProcessor(SignalProcessor):
             logger.error(f"Unexpected error fetching trademarks: {e}")
             return self._get_sample_data(company, start, end)
 
+    async def _fetch_owner(
+        self,
+        client: httpx.AsyncClient,
+        owner_name: str
+    ) -> Optional[List[Dict[str, Any]]]:
+        """Fetch one owner name's trademarks; None if the request failed"""
+        # USPTO TSDR API - search by owner name
+        params = {
+            "ownerName": owner_name,
+            "status": "all",
+        }
+
+        try:
+            response = await client.get(self.tsdr_api_url, params=params)
+            response.raise_for_status()
+        except httpx.HTTPError as e:
+            logger.warning(f"Error fetching trademarks for owner {owner_name}: {e}")
+            return None
+
+        data = response.json()
+        return data.get("trademarks", [])
+
     def process(self, company: Company, raw_data: Dict[str, Any]) -> List[Signal]:
         """
         Process trademark data into signals.
@@ -165,21 +275,17 @@ class TrademarkFilingsProcessor(SignalProcessor):
         signals = []
 
         # Categorize trademarks by status
-        new_applications = []
-        registered = []
-        abandoned = []
-        opposed = []
+        buckets = {bucket: [] for bucket in self._STATUS_BUCKET_NAMES}
+        status_buckets = self._STATUS_BUCKETS
 
         for tm in trademarks:
-            status = tm.get("status", "").lower()
-            if status in ("new application", "pending", "published"):
-                new_applications.append(tm)
-            elif status in ("registered", "live"):
-                registered.append(tm)
-            elif status in ("abandoned", "dead", "cancelled"):
-                abandoned.append(tm)
-            elif status in ("opposition", "opposed"):
-                opposed.append(tm)
+            bucket = status_buckets.get(tm.get("status", "").lower())
+            if bucket is not None:
+                buckets[bucket].append(tm)
+
+        new_applications = buckets["new_applications"]
+        abandoned = buckets["abandoned"]
+        opposed = buckets["opposed"]
 
         # Analyze Nice classes for new applications
         new_classes = set()
@@ -192,6 +298,8 @@ class TrademarkFilingsProcessor(SignalProcessor):
                 if cls_num in self.GROWTH_CLASSES:
                     growth_class_filings += 1
 
+        sorted_classes = sorted(new_classes)
+
         # Signal 1: New trademark applications
         if new_applications:
             score = min(60, len(new_applications) * 15)
@@ -204,11 +312,8 @@ class TrademarkFilingsProcessor(SignalProcessor):
             if len(new_classes) > 2:
                 score = min(100, score + 20)
 
-            class_descriptions = [
-                self.NICE_CLASSES.get(c, f"Class {c}")
-                for c in sorted(new_classes)
-                if c in self.NICE_CLASSES
-            ]
+            class_names = self.NICE_CLASSES
+            class_descriptions = [class_names[c] for c in sorted_classes if c in class_names]
 
             description = (
                 f"New trademark applications: {len(new_applications)} filings"
@@ -224,7 +329,7 @@ class TrademarkFilingsProcessor(SignalProcessor):
                 raw_value={
                     "event_type": "new_applications",
                     "count": len(new_applications),
-                    "nice_classes": sorted(new_classes),
+                    "nice_classes": sorted_classes,
                     "growth_class_filings": growth_class_filings,
                     "marks": [tm.get("mark_text", "") for tm in new_applications[:5]],
                 },
@@ -309,56 +414,7 @@ class TrademarkFilingsProcessor(SignalProcessor):
         self, company: Company, start: datetime, end: datetime
     ) -> Dict[str, Any]:
         """Return sample trademark data for when the API is unavailable."""
-        if company.ticker == "UBER":
-            sample_trademarks = [
-                {
-                    "serial_number": "98765432",
-                    "mark_text": "UBER SHUTTLE",
-                    "status": "new application",
-                    "filing_date": "2026-01-15",
-                    "nice_classes": [39, 42],
-                    "owner": "Uber Technologies, Inc.",
-                    "description": "Transportation scheduling and routing services",
-                },
-                {
-                    "serial_number": "98765433",
-                    "mark_text": "UBER TEENS",
-                    "status": "pending",
-                    "filing_date": "2025-11-20",
-                    "nice_classes": [39, 9],
-                    "owner": "Uber Technologies, Inc.",
-                    "description": "Ride-sharing services for minors with parental controls",
-                },
-                {
-                    "serial_number": "98765434",
-                    "mark_text": "UBER PAY",
-                    "status": "published",
-                    "filing_date": "2025-10-05",
-                    "nice_classes": [36, 42],
-                    "owner": "Uber Technologies, Inc.",
-                    "description": "Electronic payment processing services",
-                },
-                {
-                    "serial_number": "87654321",
-                    "mark_text": "UBER RUSH",
-                    "status": "abandoned",
-                    "filing_date": "2019-03-15",
-                    "nice_classes": [39],
-                    "owner": "Uber Technologies, Inc.",
-                    "description": "Same-day delivery services",
-                },
-                {
-                    "serial_number": "87654322",
-                    "mark_text": "UBER COPTER",
-                    "status": "registered",
-                    "filing_date": "2019-06-01",
-                    "nice_classes": [39],
-                    "owner": "Uber Technologies, Inc.",
-                    "description": "Helicopter transportation services",
-                },
-            ]
-        else:
-            sample_trademarks = []
+        sample_trademarks = _UBER_SAMPLE_TRADEMARKS if company.ticker == "UBER" else ()
 
         return {
             "company_id": company.id,
@@ -40,8 +40,6 @@ Update Frequency: Hourly (real-time signal)
 
 from typing import List, Any, Dict, Optional
 from datetime import datetime, timedelta
-import hashlib
-import json
 import re
 
 import httpx
@@ -56,42 +54,115 @@ from ...core.signal_processor import (
 )
 from ...core.signal import Signal, SignalCategory, SignalMetadata
 from ...core.company import Company
+from ...core.hashing import hash_items
+from ...core.loop_local import LoopLocal
+
+
+# Sample data is constant, so it is built once and shared (treat as read-only)
+_UBER_SAMPLE_TWEETS = (
+    {
+        "text": "@Uber just had the best ride! Driver was super friendly and car was spotless. Thank you!",
+        "created_at": "2026-02-07T10:30:00Z",
+        "public_metrics": {"like_count": 5, "retweet_count": 1, "reply_count": 2},
+    },
+    {
+        "text": "Uber's autonomous vehicles are the future. Rode in one in SF yesterday - amazing experience. $UBER",
+        "created_at": "2026-02-07T09:15:00Z",
+        "public_metrics": {"like_count": 45, "retweet_count": 12, "reply_count": 8},
+    },
+    {
+        "text": "Why is Uber so expensive now? Surge pricing is out of control. Might switch to Lyft.",
+        "created_at": "2026-02-06T20:00:00Z",
+        "public_metrics": {"like_count": 23, "retweet_count": 5, "reply_count": 15},
+    },
+    {
+        "text": "Uber Eats delivered my food cold again. Terrible service. Never again.",
+        "created_at": "2026-02-06T18:45:00Z",
+        "public_metrics": {"like_count": 8, "retweet_count": 2, "reply_count": 3},
+    },
+    {
+        "text": "$UBER earnings beat expectations! Strong Q4 results. Going long.",
+        "created_at": "2026-02-05T16:00:00Z",
+        "public_metrics": {"like_count": 102, "retweet_count": 34, "reply_count": 21},
+    },
+)
 
 
 class TwitterSentimentProcessor(SignalProcessor):
     """Process Twitter/X mentions and sentiment"""
 
     # Positive sentiment keywords
-    POSITIVE_KEYWORDS = [
+    POSITIVE_KEYWORDS = frozenset([
         "love", "great", "amazing", "excellent", "best", "awesome",
         "thank you", "thanks", "appreciate", "happy", "fantastic",
         "recommend", "impressed", "perfect", "wonderful"
-    ]
+    ])
 
     # Negative sentiment keywords
-    NEGATIVE_KEYWORDS = [
+    NEGATIVE_KEYWORDS = frozenset([
         "hate", "terrible", "worst", "awful", "bad", "disappointed",
         "angry", "frustrated", "useless", "horrible", "scam",
         "never again", "avoid", "warning", "boycott", "disgusting"
-    ]
+    ])
 
     # Crisis keywords (very negative)
-    CRISIS_KEYWORDS = [
+    CRISIS_KEYWORDS = frozenset([
         "lawsuit", "investigation", "fraud", "scandal", "breach",
-        "hack", "outage", "down", "crash", "broken", "lawsuit"
-    ]
+        "hack", "outage", "down", "crash", "broken"
+    ])
+
+    # Every keyword in one case-insensitive, word-bounded alternation, scanned
+    # once per tweet: "bad" no longer fires inside "badge", nor "hack" inside
+    # "hackathon"
+    _KEYWORD_RE = re.compile(
+        r"\b(?:"
+        + "|".join(map(re.escape, sorted(
+            POSITIVE_KEYWORDS | NEGATIVE_KEYWORDS | CRISIS_KEYWORDS, key=len, reverse=True
+        )))
+        + r")\b",
+        re.IGNORECASE,
+    )
+
+    # Shared across instances (one per event loop) so the api.twitter.com
+    # connection stays warm between scheduled fetches
+    _clients: LoopLocal[httpx.AsyncClient] = LoopLocal(
+        lambda: httpx.AsyncClient(
+            http2=True,
+            timeout=30.0,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        )
+    )
 
-    def __init__(self, twitter_bearer_token: Optional[str] = None):
+    def __init__(self, twitter_bearer_token: Optional[str] = None, max_pages: int = 5):
         """
         Initialize processor.
 
         Args:
             twitter_bearer_token: Twitter API v2 bearer token
                                  Get from: https://developer.twitter.com/
+            max_pages: Most search result pages (100 tweets each) to fetch
+                       per company
         """
         self.bearer_token = twitter_bearer_token
+        self.max_pages = max_pages
         self.api_url = "https://api.twitter.com/2/tweets/search/recent"
 
+    @classmethod
+    def _get_client(cls) -> httpx.AsyncClient:
+        """Return the running loop's shared HTTP client, creating it on first use"""
+        client = cls._clients.get()
+        if client.is_closed:
+            cls._clients.pop()
+            client = cls._clients.get()
+        return client
+
+    @classmethod
+    async def aclose(cls) -> None:
+        """Close the running loop's shared HTTP client"""
+        client = cls._clients.pop()
+        if client is not None:
+            await client.aclose()
+
     @property
     def metadata(self) -> SignalProcessorMetadata:
         return SignalProcessorMetadata(
@@ -143,23 +214,48 @@ class TwitterSentimentProcessor(SignalProcessor):
         }
 
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                logger.info(f"Fetching tweets for {company.ticker}")
-                response = await client.get(self.api_url, params=params, headers=headers)
-                response.raise_for_status()
-
-                data = response.json()
-                tweets = data.get("data", [])
-
-                logger.info(f"Found {len(tweets)} tweets for {company.ticker}")
-
-                return {
-                    "company_id": company.id,
-                    "ticker": company.ticker,
-                    "tweets": tweets,
-                    "meta": data.get("meta", {}),
-                    "timestamp": datetime.utcnow(),
-                }
+            client = self._get_client()
+            logger.info(f"Fetching tweets for {company.ticker}")
+
+            # Pages chain through meta.next_token, so they are fetched in
+            # order (concurrency comes from fetching companies in parallel)
+            tweets = []
+            meta = {}
+            pages_fetched = 0
+            page_params = params
+            while True:
+                try:
+                    response = await client.get(self.api_url, params=page_params, headers=headers)
+                    response.raise_for_status()
+                    data = response.json()
+                except (httpx.HTTPError, ValueError) as e:
+                    if not pages_fetched:
+                        raise
+                    # A later page failing should not throw away the tweets
+                    # already collected; return what earlier pages gave us
+                    logger.warning(
+                        f"Stopping after {pages_fetched} pages for {company.ticker}: {e}"
+                    )
+                    break
+
+                tweets.extend(data.get("data", []))
+                meta = data.get("meta", {})
+                pages_fetched += 1
+
+                next_token = meta.get("next_token")
+                if not next_token or pages_fetched >= self.max_pages:
+                    break
+                page_params = {**params, "next_token": next_token}
+
+            logger.info(f"Fetched {pages_fetched} pages, {len(tweets)} tweets for {company.ticker}")
+
+            return {
+                "company_id": company.id,
+                "ticker": company.ticker,
+                "tweets": tweets,
+                "meta": {**meta, "result_count": len(tweets)},
+                "timestamp": datetime.utcnow(),
+            }
 
         except httpx.HTTPStatusError as e:
             if e.response.status_code == 401:
@@ -195,13 +291,16 @@ class TwitterSentimentProcessor(SignalProcessor):
         crisis_count = 0
         total_engagement = 0
 
-        for tweet in tweets:
-            text = tweet.get("text", "").lower()
+        keyword_re = self._KEYWORD_RE
+        positive, negative, crisis = self.POSITIVE_KEYWORDS, self.NEGATIVE_KEYWORDS, self.CRISIS_KEYWORDS
 
-            # Count keywords
-            pos_score = sum(1 for kw in self.POSITIVE_KEYWORDS if kw in text)
-            neg_score = sum(1 for kw in self.NEGATIVE_KEYWORDS if kw in text)
-            crisis_score = sum(1 for kw in self.CRISIS_KEYWORDS if kw in text)
+        for tweet in tweets:
+            # Count distinct keywords present, from a single scan; only the
+            # few matched words are lowercased, not the whole tweet
+            found = {kw.lower() for kw in keyword_re.findall(tweet.get("text", ""))}
+            pos_score = len(found & positive)
+            neg_score = len(found & negative)
+            crisis_score = len(found & crisis)
 
             # Classify tweet
             if crisis_score > 0:
@@ -278,9 +377,7 @@ class TwitterSentimentProcessor(SignalProcessor):
                 source_url=f"https://twitter.com/search?q={company.ticker}",
                 source_name="Twitter/X",
                 processing_notes=f"Analyzed {total_tweets} tweets",
-                raw_data_hash=hashlib.md5(
-                    json.dumps(tweets, sort_keys=True, default=str).encode()
-                ).hexdigest(),
+                raw_data_hash=hash_items(tweets),
             ),
             description=description,
             tags=["twitter", "social_media", "sentiment"],
@@ -294,36 +391,7 @@ class TwitterSentimentProcessor(SignalProcessor):
 
         Realistic sample tweets for Uber.
         """
-        if company.ticker == "UBER":
-            sample_tweets = [
-                {
-                    "text": "@Uber just had the best ride! Driver was super friendly and car was spotless. Thank you!",
-                    "created_at": "2026-02-07T10:30:00Z",
-                    "public_metrics": {"like_count": 5, "retweet_count": 1, "reply_count": 2},
-                },
-                {
-                    "text": "Uber's autonomous vehicles are the future. Rode in one in SF yesterday - amazing experience. $UBER",
-                    "created_at": "2026-02-07T09:15:00Z",
-                    "public_metrics": {"like_count": 45, "retweet_count": 12, "reply_count": 8},
-                },
-                {
-                    "text": "Why is Uber so expensive now? Surge pricing is out of control. Might switch to Lyft.",
-                    "created_at": "2026-02-06T20:00:00Z",
-                    "public_metrics": {"like_count": 23, "retweet_count": 5, "reply_count": 15},
-                },
-                {
-                    "text": "Uber Eats delivered my food cold again. Terrible service. Never again.",
-                    "created_at": "2026-02-06T18:45:00Z",
-                    "public_metrics": {"like_count": 8, "retweet_count": 2, "reply_count": 3},
-                },
-                {
-                    "text": "$UBER earnings beat expectations! Strong Q4 results. Going long.",
-                    "created_at": "2026-02-05T16:00:00Z",
-                    "public_metrics": {"like_count": 102, "retweet_count": 34, "reply_count": 21},
-                },
-            ]
-        else:
-            sample_tweets = []
+        sample_tweets = _UBER_SAMPLE_TWEETS if company.ticker == "UBER" else ()
 
         return {
             "company_id": company.id,
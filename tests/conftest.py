@@ -0,0 +1,7 @@
+"""Shared pytest setup"""
+
+import os
+import sys
+
+# Make `src` importable when running from the repo root (as scripts/ does)
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
@@ -0,0 +1,35 @@
+"""Stable content hashes for raw_data_hash"""
+
+from datetime import datetime
+
+from src.core.hashing import hash_bytes, hash_items, hash_payload
+
+
+def test_hash_payload_is_pinned():
+    # Stored hashes are compared across runs and releases; this must not drift
+    assert hash_payload({"b": [1, 2.5, None], "a": "x"}) == "4fe33b344d21ff40c6e4580be8b8098d"
+
+
+def test_hash_payload_ignores_key_order():
+    assert hash_payload({"a": 1, "b": {"y": 2, "x": 3}}) == hash_payload({"b": {"x": 3, "y": 2}, "a": 1})
+
+
+def test_hash_payload_tuples_match_lists():
+    assert hash_payload([("2026-01-01", 1, 0.5)]) == hash_payload([["2026-01-01", 1, 0.5]])
+
+
+def test_hash_payload_handles_non_json_types():
+    when = datetime(2026, 1, 1, 12, 30)
+    assert hash_payload({1: when}) == hash_payload({"1": when})
+    assert hash_payload({"at": when}) != hash_payload({"at": datetime(2026, 1, 2)})
+
+
+def test_hash_items_is_pinned_and_order_sensitive():
+    items = [{"a": 1}, {"b": 2}]
+    assert hash_items(items) == "aac208bb446868909f65b03b1509a827"
+    assert hash_items(iter(items)) == hash_items(items)
+    assert hash_items(reversed(items)) != hash_items(items)
+
+
+def test_hash_bytes_is_pinned():
+    assert hash_bytes(b"abc") == "cf4ab791c62b8d2b2109c90275287816"
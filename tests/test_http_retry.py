@@ -0,0 +1,107 @@
+"""Retrying GET: Retry-After, retryable statuses and giving up"""
+
+from datetime import UTC, datetime, timedelta
+from email.utils import format_datetime
+
+import httpx
+import pytest
+
+from src.core import http_retry
+from src.core.http_retry import _retry_after_seconds, get_with_retry
+
+URL = "https://api.example.com/items"
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    recorded = []
+
+    async def fake_sleep(seconds: float) -> None:
+        recorded.append(seconds)
+
+    monkeypatch.setattr(http_retry.asyncio, "sleep", fake_sleep)
+    return recorded
+
+
+def _client(*responses) -> httpx.AsyncClient:
+    """Client serving `responses` in order; an exception instance is raised instead"""
+    queue = list(responses)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        response = queue.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+def _retry_after(value: str) -> httpx.Response:
+    return httpx.Response(429, headers={"Retry-After": value})
+
+
+def test_retry_after_seconds():
+    assert _retry_after_seconds(_retry_after("3")) == 3.0
+    assert _retry_after_seconds(_retry_after("-1")) == 0.0
+    assert _retry_after_seconds(_retry_after("soon")) is None
+    assert _retry_after_seconds(httpx.Response(429)) is None
+
+
+def test_retry_after_http_date():
+    retry_at = datetime.now(UTC) + timedelta(seconds=30)
+    delay = _retry_after_seconds(_retry_after(format_datetime(retry_at, usegmt=True)))
+    assert 28 <= delay <= 30
+
+    past = datetime.now(UTC) - timedelta(hours=1)
+    assert _retry_after_seconds(_retry_after(format_datetime(past, usegmt=True))) == 0.0
+
+
+async def test_429_waits_retry_after(sleeps):
+    async with _client(_retry_after("2"), httpx.Response(200, json={"ok": True})) as client:
+        response = await get_with_retry(client, URL)
+
+    assert response.json() == {"ok": True}
+    assert sleeps == [2.0]
+
+
+@pytest.mark.parametrize("status", [500, 502, 503, 504])
+async def test_5xx_retried_with_exponential_backoff(sleeps, status):
+    responses = [httpx.Response(status), httpx.Response(status), httpx.Response(200)]
+    async with _client(*responses) as client:
+        response = await get_with_retry(client, URL, base_delay=0.5)
+
+    assert response.status_code == 200
+    assert 0.5 <= sleeps[0] < 0.6
+    assert 1.0 <= sleeps[1] < 1.1
+
+
+async def test_transport_error_retried(sleeps):
+    async with _client(httpx.ConnectError("boom"), httpx.Response(200)) as client:
+        response = await get_with_retry(client, URL)
+
+    assert response.status_code == 200
+    assert len(sleeps) == 1
+
+
+async def test_gives_up_after_max_attempts(sleeps):
+    async with _client(*(httpx.Response(503) for _ in range(3))) as client:
+        with pytest.raises(httpx.HTTPStatusError):
+            await get_with_retry(client, URL, max_attempts=3)
+
+    assert len(sleeps) == 2
+
+
+async def test_gives_up_on_repeated_transport_errors(sleeps):
+    async with _client(*(httpx.ConnectError("boom") for _ in range(2))) as client:
+        with pytest.raises(httpx.ConnectError):
+            await get_with_retry(client, URL, max_attempts=2)
+
+    assert len(sleeps) == 1
+
+
+async def test_client_errors_are_not_retried(sleeps):
+    async with _client(httpx.Response(404)) as client:
+        with pytest.raises(httpx.HTTPStatusError):
+            await get_with_retry(client, URL)
+
+    assert sleeps == []
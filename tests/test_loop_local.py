@@ -0,0 +1,43 @@
+"""Per-event-loop values"""
+
+import asyncio
+
+from src.core.loop_local import LoopLocal
+
+
+async def _get_twice(local: LoopLocal) -> object:
+    first = local.get()
+    assert local.get() is first
+    return first
+
+
+def test_each_loop_gets_its_own_value():
+    created = []
+    local = LoopLocal(lambda: created.append(object()) or created[-1])
+
+    first = asyncio.run(_get_twice(local))
+    second = asyncio.run(_get_twice(local))
+
+    assert first is not second
+    assert created == [first, second]
+
+
+def test_loop_local_lock_survives_a_new_loop():
+    # The failure LoopLocal exists to prevent: a lock bound to a dead loop
+    local = LoopLocal(asyncio.Lock)
+
+    async def use_lock():
+        async with local.get():
+            await asyncio.sleep(0)
+
+    asyncio.run(use_lock())
+    asyncio.run(use_lock())
+
+
+async def test_pop_forgets_the_running_loops_value():
+    local = LoopLocal(object)
+
+    assert local.pop() is None
+    value = local.get()
+    assert local.pop() is value
+    assert local.get() is not value
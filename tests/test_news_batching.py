@@ -0,0 +1,74 @@
+"""NewsAPI multi-company batching"""
+
+from datetime import datetime
+
+import httpx
+import orjson
+
+from src.core.company import Company
+from src.core.loop_local import LoopLocal
+from src.signal_types.alternative.news_sentiment import NewsSentimentProcessor
+
+UBER = Company(id="UBER", name="Uber", ticker="UBER")
+LYFT = Company(id="LYFT", name="Lyft", ticker="LYFT")
+
+START, END = datetime(2026, 1, 1), datetime(2026, 1, 8)
+
+
+def _processor(handler) -> NewsSentimentProcessor:
+    processor = NewsSentimentProcessor(newsapi_key="test-key")
+    processor._clients = LoopLocal(
+        lambda: httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    )
+    return processor
+
+
+def _article(title: str) -> dict:
+    return {"title": title, "description": "", "publishedAt": "2026-01-01T00:00:00Z"}
+
+
+async def test_fetch_many_issues_one_query_and_routes_articles():
+    queries = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        queries.append(request.url.params["q"])
+        articles = [
+            _article("Uber beats estimates"),
+            _article("Lyft expands to new cities"),
+            _article("Uber and Lyft drivers strike"),
+        ]
+        return httpx.Response(200, content=orjson.dumps({"articles": articles, "totalResults": 42}))
+
+    raw = await _processor(handler).fetch_many([UBER, LYFT], START, END)
+
+    assert queries == ['("Uber" OR "UBER") OR ("Lyft" OR "LYFT")']
+    assert [a["title"] for a in raw["UBER"]["articles"]] == [
+        "Uber beats estimates",
+        "Uber and Lyft drivers strike",
+    ]
+    assert [a["title"] for a in raw["LYFT"]["articles"]] == [
+        "Lyft expands to new cities",
+        "Uber and Lyft drivers strike",
+    ]
+    # totalResults describes the combined query, not either company
+    assert raw["UBER"]["total_results"] is None
+
+
+async def test_fetch_many_single_company_keeps_total_results():
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200, content=orjson.dumps({"articles": [_article("Uber")], "totalResults": 7})
+        )
+
+    raw = await _processor(handler).fetch_many([UBER], START, END)
+
+    assert raw["UBER"]["total_results"] == 7
+
+
+async def test_fetch_many_failed_batch_maps_to_empty():
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(429)
+
+    raw = await _processor(handler).fetch_many([UBER, LYFT], START, END)
+
+    assert raw == {"UBER": {}, "LYFT": {}}
@@ -0,0 +1,82 @@
+"""NewsAPI totalResults probe and last-poll reuse"""
+
+from datetime import datetime
+
+import httpx
+import orjson
+
+from src.core.company import Company
+from src.core.loop_local import LoopLocal
+from src.signal_types.alternative.news_sentiment import NewsSentimentProcessor
+
+UBER = Company(id="UBER", name="Uber", ticker="UBER")
+
+START, END = datetime(2026, 1, 1), datetime(2026, 1, 8)
+
+
+class _FakeNewsAPI:
+    """Serves a fixed article list and records each request's pageSize"""
+
+    def __init__(self, total_results: int):
+        self.total_results = total_results
+        self.page_sizes = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        page_size = int(request.url.params["pageSize"])
+        self.page_sizes.append(page_size)
+        articles = [
+            {"title": f"Uber growth story {i}", "description": "", "publishedAt": None}
+            for i in range(3)
+        ][:page_size]
+        payload = {"articles": articles, "totalResults": self.total_results}
+        return httpx.Response(200, content=orjson.dumps(payload))
+
+
+def _processor(api: _FakeNewsAPI) -> NewsSentimentProcessor:
+    processor = NewsSentimentProcessor(newsapi_key="test-key")
+    processor._clients = LoopLocal(lambda: httpx.AsyncClient(transport=httpx.MockTransport(api)))
+    return processor
+
+
+async def test_unchanged_total_only_costs_a_probe():
+    api = _FakeNewsAPI(total_results=3)
+    processor = _processor(api)
+
+    first = await processor.fetch(UBER, START, END)
+    second = await processor.fetch(UBER, START, END)
+
+    assert api.page_sizes == [100, 1]
+    assert second["articles"] == first["articles"]
+    assert second["articles"] is not first["articles"]
+
+
+async def test_changed_total_downloads_again():
+    api = _FakeNewsAPI(total_results=3)
+    processor = _processor(api)
+
+    await processor.fetch(UBER, START, END)
+    api.total_results = 4
+    await processor.fetch(UBER, START, END)
+
+    assert api.page_sizes == [100, 1, 100]
+
+
+async def test_unchanged_poll_reuses_signal_copy():
+    api = _FakeNewsAPI(total_results=3)
+    processor = _processor(api)
+
+    first = processor.process(UBER, await processor.fetch(UBER, START, END))
+    second = processor.process(UBER, await processor.fetch(UBER, START, END))
+
+    assert len(first) == len(second) == 1
+    assert second[0] is not first[0]
+    assert second[0].score == first[0].score
+
+
+async def test_instances_do_not_share_polls():
+    api = _FakeNewsAPI(total_results=3)
+
+    await _processor(api).fetch(UBER, START, END)
+    await _processor(api).fetch(UBER, START, END)
+
+    assert api.page_sizes == [100, 100]
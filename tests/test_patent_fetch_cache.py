@@ -0,0 +1,62 @@
+"""Bounded, copy-on-read PatentsView fetch cache"""
+
+from collections import OrderedDict
+from datetime import datetime
+
+import httpx
+import orjson
+import pytest
+
+from src.core.company import Company
+from src.core.loop_local import LoopLocal
+from src.signal_types.alternative import patent_filings
+from src.signal_types.alternative.patent_filings import PatentFilingsProcessor
+
+UBER = Company(id="UBER", name="Uber", ticker="UBER")
+TSLA = Company(id="TSLA", name="Tesla", ticker="TSLA")
+
+START, END = datetime(2026, 1, 1), datetime(2026, 2, 1)
+
+
+@pytest.fixture
+def requests(monkeypatch):
+    """Fresh cache and a fake PatentsView; yields the list of served requests"""
+    served = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        served.append(request)
+        payload = {
+            "patents": [{"patent_number": "1", "patent_type": "utility", "cited_patent_count": 3}],
+            "total_patent_count": 1,
+        }
+        return httpx.Response(200, content=orjson.dumps(payload))
+
+    monkeypatch.setattr(patent_filings, "_FETCH_CACHE", OrderedDict())
+    monkeypatch.setattr(
+        PatentFilingsProcessor,
+        "_clients",
+        LoopLocal(lambda: httpx.AsyncClient(transport=httpx.MockTransport(handler))),
+    )
+    return served
+
+
+async def test_hit_is_shared_across_instances_and_copied(requests):
+    first = await PatentFilingsProcessor().fetch(UBER, START, END)
+    first["patents"].clear()
+
+    second = await PatentFilingsProcessor().fetch(UBER, START, END)
+
+    assert len(requests) == 1
+    assert second["patents"] == [{"patent_number": "1", "patent_type": "utility", "cited_patent_count": 3}]
+
+
+async def test_least_recently_used_entry_is_evicted(requests, monkeypatch):
+    monkeypatch.setattr(patent_filings, "_FETCH_CACHE_MAXSIZE", 1)
+    processor = PatentFilingsProcessor()
+
+    await processor.fetch(UBER, START, END)
+    await processor.fetch(TSLA, START, END)
+    await processor.fetch(UBER, START, END)
+
+    assert len(requests) == 3
+    assert list(patent_filings._FETCH_CACHE) == [("UBER", "2026-01-01", "2026-02-01")]
@@ -0,0 +1,81 @@
+"""Token-bucket pacing and server-imposed backoff"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from src.core import rate_limiter
+from src.core.rate_limiter import TokenBucketLimiter, get_rate_limiter
+
+
+class _Clock:
+    """Fake monotonic clock; sleeping advances it and is recorded"""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    async def sleep(self, seconds: float) -> None:
+        self.sleeps.append(round(seconds, 6))
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(rate_limiter, "time", SimpleNamespace(monotonic=clock.monotonic))
+    monkeypatch.setattr(rate_limiter.asyncio, "sleep", clock.sleep)
+    return clock
+
+
+async def test_burst_up_to_capacity_then_paced(clock):
+    limiter = TokenBucketLimiter(capacity=2, refill_per_sec=10)
+
+    for _ in range(3):
+        await limiter.acquire()
+
+    # Two tokens on hand, the third waits one refill interval
+    assert clock.sleeps == [0.1]
+
+
+async def test_refill_is_capped_at_capacity(clock):
+    limiter = TokenBucketLimiter(capacity=2, refill_per_sec=10)
+    await limiter.acquire()
+    await limiter.acquire()
+
+    clock.now += 3600
+    for _ in range(3):
+        await limiter.acquire()
+
+    assert clock.sleeps == [0.1]
+
+
+async def test_backoff_drains_and_pauses(clock):
+    limiter = TokenBucketLimiter(capacity=5, refill_per_sec=10)
+
+    limiter.backoff(5)
+    await limiter.acquire()
+
+    # Waits out the pause, then one token's refill (nothing accrued meanwhile)
+    assert clock.sleeps == [5, 0.1]
+
+
+async def test_backoff_never_shortens_a_pause(clock):
+    limiter = TokenBucketLimiter(capacity=5, refill_per_sec=10)
+
+    limiter.backoff(10)
+    limiter.backoff(2)
+    await limiter.acquire()
+
+    assert clock.sleeps == [10, 0.1]
+
+
+def test_limiter_is_shared_per_host():
+    first = get_rate_limiter("limiter-test.example", capacity=1, refill_per_sec=1)
+    again = get_rate_limiter("limiter-test.example", capacity=99, refill_per_sec=99)
+
+    assert again is first
+    assert get_rate_limiter("other.example", capacity=1, refill_per_sec=1) is not first
@@ -0,0 +1,75 @@
+"""Stack Overflow tag stats filed under the tags that were requested"""
+
+from datetime import datetime
+
+import httpx
+import orjson
+import pytest
+
+from src.core.company import Company
+from src.core.loop_local import LoopLocal
+from src.signal_types.alternative.stackoverflow_activity import StackOverflowActivityProcessor
+
+GOOGL = Company(id="GOOGL", name="Alphabet", ticker="GOOGL")
+
+START, END = datetime(2026, 1, 1), datetime(2026, 1, 8)
+
+# "gcp" is a synonym of "google-cloud-platform"
+_TAG_INFO = {
+    "android": {"name": "android", "count": 1_400_000, "followers_count": 380_000},
+    "gcp": {"name": "google-cloud-platform", "count": 85_000, "followers_count": 12_000},
+}
+_SYNONYMS = [
+    {"from_tag": "gcp", "to_tag": "google-cloud-platform"},
+    {"from_tag": "google-cloud", "to_tag": "google-cloud-platform"},
+]
+
+
+@pytest.fixture
+def paths(monkeypatch):
+    """Fake Stack Exchange API; yields the list of requested paths"""
+    served = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        served.append(request.url.path)
+        _, _, tags, endpoint = request.url.path.rsplit("/", 3)
+        if endpoint == "info":
+            items = [_TAG_INFO[tag] for tag in tags.split(";") if tag in _TAG_INFO]
+        else:
+            canonical = set(tags.split(";"))
+            items = [s for s in _SYNONYMS if s["to_tag"] in canonical]
+        return httpx.Response(200, content=orjson.dumps({"items": items}))
+
+    monkeypatch.setattr(
+        StackOverflowActivityProcessor,
+        "_clients",
+        LoopLocal(lambda: httpx.AsyncClient(transport=httpx.MockTransport(handler))),
+    )
+    StackOverflowActivityProcessor.clear_cache()
+    yield served
+    StackOverflowActivityProcessor.clear_cache()
+
+
+async def test_synonym_is_reported_under_requested_tag(paths):
+    processor = StackOverflowActivityProcessor()
+    processor.tag_mappings["GOOGL"] = ["android", "gcp"]
+
+    raw = await processor.fetch(GOOGL, START, END)
+
+    assert [(t["tag"], t["count"]) for t in raw["tags"]] == [("android", 1_400_000), ("gcp", 85_000)]
+    assert paths[-1].endswith("/tags/android;google-cloud-platform/synonyms")
+
+    # Cached under the requested tag, so the next fetch makes no requests
+    served = len(paths)
+    await processor.fetch(GOOGL, START, END)
+    assert len(paths) == served
+
+
+async def test_synonyms_only_looked_up_when_a_tag_is_missing(paths):
+    processor = StackOverflowActivityProcessor()
+    processor.tag_mappings["GOOGL"] = ["android"]
+
+    raw = await processor.fetch(GOOGL, START, END)
+
+    assert [t["tag"] for t in raw["tags"]] == ["android"]
+    assert [path.rsplit("/", 1)[-1] for path in paths] == ["info"]
@@ -0,0 +1,76 @@
+"""Exhibit 21 table parsing"""
+
+from src.signal_types.alternative.subsidiary_registrations import _parse_exhibit21
+
+# Layouts modeled on real 10-K Exhibit 21 filings: a two-column table with a
+# long header, spacer cells and inline styling, plus entity-escaped names
+TWO_COLUMN_EXHIBIT = """
+<html><body>
+<p style="text-align:center"><b>SUBSIDIARIES OF THE REGISTRANT</b></p>
+<table>
+  <tr>
+    <td style="width:60%"><p><b><u>Name of Subsidiary</u></b></p></td>
+    <td>&nbsp;</td>
+    <td><p><b><u>State or Other Jurisdiction of Incorporation</u></b></p></td>
+  </tr>
+  <tr>
+    <td><font size="2">Uber Technologies, Inc.</font></td>
+    <td>&#160;</td>
+    <td><font size="2">Delaware</font></td>
+  </tr>
+  <tr>
+    <td>Uber Portier B.V.</td><td></td><td>Netherlands</td>
+  </tr>
+  <tr>
+    <td>Careem Networks&nbsp;FZ&#8209;LLC</td><td></td><td>United Arab Emirates</td>
+  </tr>
+  <tr>
+    <td>Postmates&nbsp;&amp;&nbsp;Co. LLC</td><td></td><td>Delaware</td>
+  </tr>
+</table>
+</body></html>
+"""
+
+OWNERSHIP_COLUMN_EXHIBIT = """
+<table>
+  <tr><th>Entity</th><th>Jurisdiction of Organization</th><th>% Owned</th></tr>
+  <tr><td>Uber Freight LLC</td><td>Delaware</td><td>100%</td></tr>
+  <tr><td>Uber India Systems Private Limited</td><td>India</td><td>99.9%</td></tr>
+</table>
+"""
+
+NO_HEADER_EXHIBIT = """
+<table>
+  <tr><td>Uber London Limited</td><td>United Kingdom</td></tr>
+  <tr><td colspan="2">&nbsp;</td></tr>
+  <tr><td>Uber Japan Co., Ltd.</td><td>Japan</td></tr>
+</table>
+"""
+
+
+def test_skips_long_header_and_spacer_cells():
+    assert _parse_exhibit21(TWO_COLUMN_EXHIBIT) == [
+        {"name": "Uber Technologies, Inc.", "jurisdiction": "Delaware"},
+        {"name": "Uber Portier B.V.", "jurisdiction": "Netherlands"},
+        {"name": "Careem Networks FZ‑LLC", "jurisdiction": "United Arab Emirates"},
+        {"name": "Postmates & Co. LLC", "jurisdiction": "Delaware"},
+    ]
+
+
+def test_header_picks_jurisdiction_column_over_ownership():
+    assert _parse_exhibit21(OWNERSHIP_COLUMN_EXHIBIT) == [
+        {"name": "Uber Freight LLC", "jurisdiction": "Delaware"},
+        {"name": "Uber India Systems Private Limited", "jurisdiction": "India"},
+    ]
+
+
+def test_table_without_header_uses_last_column():
+    assert _parse_exhibit21(NO_HEADER_EXHIBIT) == [
+        {"name": "Uber London Limited", "jurisdiction": "United Kingdom"},
+        {"name": "Uber Japan Co., Ltd.", "jurisdiction": "Japan"},
+    ]
+
+
+def test_paragraph_layout_yields_nothing():
+    html = "<p>Uber Technologies, Inc. (Delaware)</p><p>Uber B.V. (Netherlands)</p>"
+    assert _parse_exhibit21(html) == []
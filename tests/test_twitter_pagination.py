@@ -0,0 +1,54 @@
+"""Twitter search pagination when a later page fails"""
+
+from datetime import datetime
+
+import httpx
+import orjson
+import pytest
+
+from src.core.company import Company
+from src.core.loop_local import LoopLocal
+from src.signal_types.alternative.twitter_sentiment import TwitterSentimentProcessor
+
+UBER = Company(id="UBER", name="Uber", ticker="UBER")
+
+START, END = datetime(2026, 1, 1), datetime(2026, 1, 8)
+
+
+def _install(monkeypatch, handler) -> None:
+    monkeypatch.setattr(
+        TwitterSentimentProcessor,
+        "_clients",
+        LoopLocal(lambda: httpx.AsyncClient(transport=httpx.MockTransport(handler))),
+    )
+
+
+def _page(request: httpx.Request, fail_on: str) -> httpx.Response:
+    token = request.url.params.get("next_token", "page1")
+    if token == fail_on:
+        return httpx.Response(503)
+    next_token = {"page1": "page2", "page2": "page3"}.get(token)
+    payload = {
+        "data": [{"id": f"{token}-{i}", "text": "uber"} for i in range(2)],
+        "meta": {"result_count": 2, **({"next_token": next_token} if next_token else {})},
+    }
+    return httpx.Response(200, content=orjson.dumps(payload))
+
+
+async def test_later_page_failure_keeps_earlier_tweets(monkeypatch):
+    _install(monkeypatch, lambda request: _page(request, fail_on="page3"))
+
+    raw = await TwitterSentimentProcessor(twitter_bearer_token="t").fetch(UBER, START, END)
+
+    assert [tweet["id"] for tweet in raw["tweets"]] == ["page1-0", "page1-1", "page2-0", "page2-1"]
+    assert raw["meta"]["result_count"] == 4
+
+
+@pytest.mark.parametrize("status", [429, 503])
+async def test_first_page_failure_still_falls_back(monkeypatch, status):
+    _install(monkeypatch, lambda request: httpx.Response(status))
+
+    processor = TwitterSentimentProcessor(twitter_bearer_token="t")
+    raw = await processor.fetch(UBER, START, END)
+
+    assert raw["tweets"] == processor._get_sample_data(UBER, START, END)["tweets"]